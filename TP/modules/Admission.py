@@ -0,0 +1,136 @@
+"""Admission
+Contrôle d'admission des calculs de triangulation.
+
+Le coût d'une demande est estimé à partir du nombre de points, avant de lire
+les coordonnées. Les demandes sont réparties en deux voies, chacune avec son
+propre nombre de places :
+- la petite voie, pour les demandes peu coûteuses, qui n'attendent donc jamais
+  derrière un gros calcul
+- la grande voie, pour les autres
+
+Une demande dont le coût dépasse le maximum est refusée (`CoutExcessif`) ; une
+demande qui n'obtient pas de place dans sa voie avant le délai d'attente l'est
+aussi (`Surcharge`).
+"""
+
+import math
+import threading
+from typing import Dict
+
+
+class CoutExcessif(Exception):
+    """Le coût estimé dépasse le maximum admis."""
+
+
+class Surcharge(Exception):
+    """Aucune place libérée dans la voie avant la fin du délai d'attente."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def cout_triangulation(nombre_points: int, delaunay: bool) -> float:
+    """Coût estimé (en points traités) d'une triangulation.
+
+    Linéaire pour l'éventail, n log n pour Delaunay.
+    """
+    if not delaunay:
+        return float(nombre_points)
+    return nombre_points * max(1.0, math.log2(max(nombre_points, 1)))
+
+
+class Voies:
+    """Petite et grande voie de calcul, bornées par des sémaphores."""
+
+    PETITE = "small"
+    GRANDE = "large"
+
+    def __init__(
+        self,
+        seuil_petite: float,
+        cout_max: float,
+        places_petite: int = 4,
+        places_grande: int = 1,
+        attente: float = 5.0,
+    ):
+        """
+        Args:
+            seuil_petite: coût maximal d'une demande de la petite voie
+            cout_max: coût au-delà duquel une demande est refusée
+            places_petite, places_grande: calculs simultanés par voie
+            attente: délai d'attente d'une place (secondes)
+        """
+        if seuil_petite > cout_max or places_petite < 1 or places_grande < 1:
+            raise ValueError("Configuration des voies invalide")
+        self.seuil_petite = seuil_petite
+        self.cout_max = cout_max
+        self.attente = attente
+        self._places = {self.PETITE: places_petite, self.GRANDE: places_grande}
+        self._semaphores = {
+            nom: threading.BoundedSemaphore(n) for nom, n in self._places.items()
+        }
+        self._occupees = {nom: 0 for nom in self._places}
+        self._verrou = threading.Lock()
+
+    def voie(self, cout: float) -> str:
+        """Voie d'une demande de coût `cout`."""
+        return self.PETITE if cout <= self.seuil_petite else self.GRANDE
+
+    def admettre(self, cout: float) -> "Place":
+        """Réserve une place dans la voie de la demande.
+
+        Returns:
+            La place, à libérer avec `liberer()` (ou en sortie de `with`).
+
+        Raises:
+            CoutExcessif: si `cout` dépasse `cout_max`.
+            Surcharge: si aucune place ne se libère avant `attente` secondes.
+        """
+        if cout > self.cout_max:
+            raise CoutExcessif(
+                f"Coût estimé {cout:.0f} supérieur au maximum {self.cout_max:.0f}"
+            )
+        nom = self.voie(cout)
+        if not self._semaphores[nom].acquire(timeout=self.attente):
+            raise Surcharge(f"Voie {nom} saturée", self.attente)
+        with self._verrou:
+            self._occupees[nom] += 1
+        return Place(self, nom)
+
+    def _liberer(self, nom: str) -> None:
+        with self._verrou:
+            self._occupees[nom] -= 1
+        self._semaphores[nom].release()
+
+    def occupation(self) -> Dict[str, Dict[str, int]]:
+        """Places occupées et totales par voie."""
+        with self._verrou:
+            return {
+                nom: {"busy": self._occupees[nom], "slots": n}
+                for nom, n in self._places.items()
+            }
+
+
+class Place:
+    """Place réservée dans une voie."""
+
+    def __init__(self, voies: Voies, voie: str):
+        self.voie = voie
+        self._voies = voies
+        self._liberee = False
+
+    def liberer(self) -> None:
+        """Libère la place (sans effet si elle l'est déjà)."""
+        if not self._liberee:
+            self._liberee = True
+            self._voies._liberer(self.voie)
+
+    def __enter__(self) -> "Place":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.liberer()
+
+
+__all__ = ["CoutExcessif", "Surcharge", "cout_triangulation", "Voies", "Place"]
@@ -0,0 +1,180 @@
+"""Analyse
+Mesures de qualité d'un maillage, calculées en une passe sur les tableaux
+plats de la triangulation (coordonnées `array('f')` et indices `array('I')`),
+sans créer d'objets `Point`.
+
+Pour chaque triangle, de côtés a, b, c et d'aire A :
+- angles minimal et maximal (degrés), opposés au plus petit et au plus grand côté
+- rayon circonscrit R = abc / 4A
+- rapport d'aspect R / 2r, avec r = 2A / (a + b + c) le rayon inscrit (1 pour
+  un triangle équilatéral, infini pour un triangle dégénéré)
+- qualité 4√3 A / (a² + b² + c²), entre 0 (dégénéré) et 1 (équilatéral)
+
+Un triangle est dégénéré si son aire est négligeable devant le carré de son
+plus grand côté.
+"""
+
+from array import array
+from math import acos, degrees, inf, sqrt
+from typing import Dict, Iterator, Tuple
+
+_EPSILON = 1e-12
+_RACINE_3 = sqrt(3.0)
+# Histogramme des angles minimaux : tranches de 10° entre 0 et 60°
+_TRANCHES_ANGLE = 6
+
+Mesure = Tuple[float, float, float, float, float, float]
+
+
+def _tableaux(triangulation) -> Tuple[array, array]:
+    """Coordonnées et indices plats d'une triangulation par indices."""
+    if triangulation.vertices is None or triangulation.indices() is None:
+        raise ValueError("Triangulation par indices attendue")
+    return triangulation.vertices.coordinates(), triangulation.indices()
+
+
+def _angle(adj1: float, adj2: float, oppose: float) -> float:
+    """Angle (degrés) entre deux côtés de carrés adj1, adj2.
+
+    Il est opposé au côté de carré `oppose`.
+    """
+    cos = (adj1 + adj2 - oppose) / (2.0 * sqrt(adj1 * adj2))
+    return degrees(acos(max(-1.0, min(1.0, cos))))
+
+
+def _mesures(coords: array, indices: array) -> Iterator[Mesure]:
+    """Mesures par triangle.
+
+    (aire, angle min, angle max, rayon circonscrit, rapport d'aspect, qualité)
+    """
+    it = iter(indices)
+    for i, j, k in zip(it, it, it, strict=True):
+        ax, ay = coords[2 * i], coords[2 * i + 1]
+        bx, by = coords[2 * j], coords[2 * j + 1]
+        cx, cy = coords[2 * k], coords[2 * k + 1]
+        # Carrés des côtés opposés à a, b, c
+        la = (bx - cx) ** 2 + (by - cy) ** 2
+        lb = (ax - cx) ** 2 + (ay - cy) ** 2
+        lc = (ax - bx) ** 2 + (ay - by) ** 2
+        aire = abs((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) * 0.5
+        somme = la + lb + lc
+        court, moyen, long = sorted((la, lb, lc))
+        if aire <= _EPSILON * long or court == 0.0:
+            yield aire, 0.0, 180.0, inf, inf, 0.0
+            continue
+        produit = sqrt(la * lb * lc)
+        rayon = produit / (4.0 * aire)
+        inscrit = 2.0 * aire / (sqrt(la) + sqrt(lb) + sqrt(lc))
+        yield (
+            aire,
+            _angle(moyen, long, court),
+            _angle(court, moyen, long),
+            rayon,
+            rayon / (2.0 * inscrit),
+            4.0 * _RACINE_3 * aire / somme,
+        )
+
+
+def mesurer(triangulation) -> Dict[str, array]:
+    """Mesures par triangle, dans des `array('d')` alignés sur les triangles."""
+    coords, indices = _tableaux(triangulation)
+    noms = (
+        "aire",
+        "angle_min",
+        "angle_max",
+        "rayon_circonscrit",
+        "rapport_aspect",
+        "qualite",
+    )
+    colonnes = {nom: array("d") for nom in noms}
+    ajouts = [colonnes[nom].append for nom in noms]
+    for m in _mesures(coords, indices):
+        for ajout, valeur in zip(ajouts, m, strict=True):
+            ajout(valeur)
+    return colonnes
+
+
+def _aires(coords: array, indices: array) -> Iterator[float]:
+    """Aire par triangle, sans les autres mesures de `_mesures`."""
+    it = iter(indices)
+    for i, j, k in zip(it, it, it, strict=True):
+        ax, ay = coords[2 * i], coords[2 * i + 1]
+        bx, by = coords[2 * j], coords[2 * j + 1]
+        cx, cy = coords[2 * k], coords[2 * k + 1]
+        yield abs((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) * 0.5
+
+
+def aires(triangulation) -> array:
+    """Aire de chaque triangle."""
+    coords, indices = _tableaux(triangulation)
+    return array("d", _aires(coords, indices))
+
+
+def resume(triangulation) -> dict:
+    """Statistiques agrégées du maillage, calculées en une passe.
+
+    Les grandeurs infinies des triangles dégénérés (rayon, rapport d'aspect)
+    sont exclues de leurs agrégats ; les valeurs absentes valent None.
+    """
+    coords, indices = _tableaux(triangulation)
+    n = degeneres = 0
+    aire_totale, aire_min, aire_max = 0.0, inf, 0.0
+    angle_min, somme_angle_min, angle_max = inf, 0.0, 0.0
+    histogramme = [0] * _TRANCHES_ANGLE
+    aspect_max, somme_aspect = 0.0, 0.0
+    rayon_max, somme_rayon = 0.0, 0.0
+    qualite_min, somme_qualite = inf, 0.0
+    for aire, amin, amax, rayon, aspect, qualite in _mesures(coords, indices):
+        n += 1
+        aire_totale += aire
+        aire_min = min(aire_min, aire)
+        aire_max = max(aire_max, aire)
+        angle_min = min(angle_min, amin)
+        somme_angle_min += amin
+        angle_max = max(angle_max, amax)
+        histogramme[min(int(amin // 10), _TRANCHES_ANGLE - 1)] += 1
+        qualite_min = min(qualite_min, qualite)
+        somme_qualite += qualite
+        if rayon == inf:
+            degeneres += 1
+            continue
+        aspect_max = max(aspect_max, aspect)
+        somme_aspect += aspect
+        rayon_max = max(rayon_max, rayon)
+        somme_rayon += rayon
+    valides = n - degeneres
+
+    def moyenne(somme: float, nombre: int) -> float | None:
+        return somme / nombre if nombre else None
+
+    return {
+        "triangleCount": n,
+        "degenerateCount": degeneres,
+        "area": {
+            "total": aire_totale,
+            "min": aire_min if n else None,
+            "max": aire_max if n else None,
+            "mean": moyenne(aire_totale, n),
+        },
+        "minAngle": {
+            "min": angle_min if n else None,
+            "mean": moyenne(somme_angle_min, n),
+            "histogram": histogramme,
+        },
+        "maxAngle": {"max": angle_max if n else None},
+        "aspectRatio": {
+            "max": aspect_max if valides else None,
+            "mean": moyenne(somme_aspect, valides),
+        },
+        "circumradius": {
+            "max": rayon_max if valides else None,
+            "mean": moyenne(somme_rayon, valides),
+        },
+        "quality": {
+            "min": qualite_min if n else None,
+            "mean": moyenne(somme_qualite, n),
+        },
+    }
+
+
+__all__ = ["mesurer", "aires", "resume"]
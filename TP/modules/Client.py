@@ -0,0 +1,286 @@
+"""Client
+Bibliothèque cliente pour les APIs `PointSetManager` et `Triangulator`.
+
+Deux clients sont fournis:
+- `APIClient` : client synchrone, basé sur une `requests.Session` dont le pool
+  de connexions est réutilisé d'une requête à l'autre, avec des timeouts.
+- `AsyncAPIClient` : client asyncio qui enregistre et triangule de nombreux
+  `PointSet` en parallèle, avec un nombre borné de requêtes en vol.
+
+Les réponses binaires sont lues en flux (`stream=True`) et décodées directement
+dans des `PointSet` / `Triangulation` adossés à des tableaux, sans passer par
+`response.content`.
+"""
+
+import asyncio
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from TP.modules.Flux import TAILLE_LOT, lire_par_lots
+from TP.modules.PointSet import PointSet
+from TP.modules.Triangulation import Triangulation
+
+# (connexion, lecture) en secondes
+DEFAULT_TIMEOUT = (3.05, 60.0)
+
+
+class APIError(Exception):
+    """Erreur renvoyée par l'un des services (code HTTP + corps d'erreur)."""
+
+    def __init__(self, action: str, status_code: int, code: str | None, message: str):
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+        super().__init__(f"{action}: HTTP {status_code}: {message}")
+
+
+def _erreur(response: requests.Response, action: str) -> APIError:
+    """Construit l'`APIError` correspondant à une réponse en échec."""
+    try:
+        error_data = response.json()
+        code = error_data.get("code")
+        message = error_data.get("message", "Unknown error")
+    except ValueError:
+        code, message = None, response.text
+    return APIError(action, response.status_code, code, message)
+
+
+class APIClient:
+    """Client synchrone pour les APIs PointSetManager et Triangulator."""
+
+    def __init__(
+        self,
+        manager_url="http://127.0.0.1:5000",
+        triangulator_url="http://127.0.0.1:5001",
+        timeout=DEFAULT_TIMEOUT,
+        pool_size: int = 10,
+        session: requests.Session | None = None,
+    ):
+        """
+        Initialise le client.
+
+        Args:
+            manager_url: URL du PointSetManager
+            triangulator_url: URL du Triangulator
+            timeout: timeout `requests` (secondes, ou couple connexion/lecture)
+            pool_size: nombre maximal de connexions gardées ouvertes par hôte
+            session: session à utiliser (une session poolée est créée sinon)
+        """
+        self.manager_url = manager_url.rstrip('/')
+        self.triangulator_url = triangulator_url.rstrip('/')
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def close(self) -> None:
+        """Ferme les connexions du pool."""
+        self.session.close()
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def register_point_set(self, point_set: PointSet) -> str:
+        """
+        Enregistre un PointSet et retourne son ID.
+
+        Args:
+            point_set: PointSet à enregistrer
+
+        Returns:
+            ID du PointSet enregistré
+
+        Raises:
+            APIError: si le PointSetManager répond en erreur
+        """
+        response = self.session.post(
+            f"{self.manager_url}/pointset",
+            data=point_set.to_bytes(),
+            headers={"Content-Type": "application/octet-stream"},
+            timeout=self.timeout,
+        )
+        with response:
+            if response.status_code == 201:
+                return response.json()["pointSetId"]
+            raise _erreur(response, "Failed to register PointSet")
+
+    def get_point_set(self, point_set_id: str) -> PointSet:
+        """
+        Récupère un PointSet par son ID.
+
+        Args:
+            point_set_id: ID du PointSet
+
+        Returns:
+            PointSet récupéré (adossé à un tableau de coordonnées)
+
+        Raises:
+            APIError: si le PointSetManager répond en erreur
+        """
+        response = self.session.get(
+            f"{self.manager_url}/pointset/{point_set_id}",
+            stream=True,
+            timeout=self.timeout,
+        )
+        with response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                return PointSet.from_stream(response.raw)
+            raise _erreur(response, "Failed to get PointSet")
+
+    def iter_point_set(
+        self, point_set_id: str, taille_lot: int = TAILLE_LOT
+    ) -> Iterator[array]:
+        """
+        Parcourt un PointSet par lots, sans le charger en entier.
+
+        La réponse reste ouverte jusqu'à la fin (ou la fermeture) de l'itérateur.
+
+        Args:
+            point_set_id: ID du PointSet
+            taille_lot: nombre maximal de points par lot
+
+        Yields:
+            Lots de coordonnées x0, y0, x1, y1, ... (`array('f')`)
+
+        Raises:
+            APIError: si le PointSetManager répond en erreur
+        """
+        response = self.session.get(
+            f"{self.manager_url}/pointset/{point_set_id}",
+            stream=True,
+            timeout=self.timeout,
+        )
+        with response:
+            if response.status_code != 200:
+                raise _erreur(response, "Failed to get PointSet")
+            response.raw.decode_content = True
+            yield from lire_par_lots(response.raw, taille_lot)
+
+    def get_triangulation(self, point_set_id: str) -> Triangulation:
+        """
+        Calcule la triangulation d'un PointSet.
+
+        Args:
+            point_set_id: ID du PointSet
+
+        Returns:
+            Structure Triangles avec la triangulation
+
+        Raises:
+            APIError: si le Triangulator répond en erreur
+        """
+        response = self.session.get(
+            f"{self.triangulator_url}/triangulation/{point_set_id}",
+            stream=True,
+            timeout=self.timeout,
+        )
+        with response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                return Triangulation.from_stream(response.raw)
+            raise _erreur(response, "Failed to get triangulation")
+
+
+class AsyncAPIClient:
+    """Client asyncio, à parallélisme borné, au-dessus d'un `APIClient` poolé.
+
+    Les appels HTTP bloquants sont exécutés dans un pool de threads dédié dont
+    la taille est celle du pool de connexions : au plus `max_concurrency`
+    requêtes sont en vol, chacune sur une connexion réutilisée.
+    """
+
+    def __init__(
+        self,
+        manager_url="http://127.0.0.1:5000",
+        triangulator_url="http://127.0.0.1:5001",
+        max_concurrency: int = 8,
+        timeout=DEFAULT_TIMEOUT,
+        client: APIClient | None = None,
+    ):
+        """
+        Initialise le client.
+
+        Args:
+            manager_url: URL du PointSetManager
+            triangulator_url: URL du Triangulator
+            max_concurrency: nombre maximal de requêtes simultanées
+            timeout: timeout `requests` de chaque requête
+            client: client synchrone à utiliser (créé sinon)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency doit être >= 1")
+        self._client = client or APIClient(
+            manager_url, triangulator_url, timeout=timeout, pool_size=max_concurrency
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _appel(self, fn, *args):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def aclose(self) -> None:
+        """Arrête le pool de threads et ferme les connexions."""
+        self._executor.shutdown(wait=True)
+        self._client.close()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def register_point_set(self, point_set: PointSet) -> str:
+        """Enregistre un PointSet et retourne son ID."""
+        return await self._appel(self._client.register_point_set, point_set)
+
+    async def get_point_set(self, point_set_id: str) -> PointSet:
+        """Récupère un PointSet par son ID."""
+        return await self._appel(self._client.get_point_set, point_set_id)
+
+    async def get_triangulation(self, point_set_id: str) -> Triangulation:
+        """Calcule la triangulation d'un PointSet."""
+        return await self._appel(self._client.get_triangulation, point_set_id)
+
+    async def register_many(self, point_sets: Iterable[PointSet]) -> List[str]:
+        """Enregistre plusieurs PointSet en parallèle, IDs dans l'ordre d'entrée."""
+        return list(
+            await asyncio.gather(*(self.register_point_set(ps) for ps in point_sets))
+        )
+
+    async def get_triangulations(
+        self, point_set_ids: Iterable[str]
+    ) -> List[Triangulation]:
+        """Triangule plusieurs PointSet déjà enregistrés, en parallèle."""
+        return list(
+            await asyncio.gather(*(self.get_triangulation(i) for i in point_set_ids))
+        )
+
+    async def triangulate_many(
+        self, point_sets: Iterable[PointSet]
+    ) -> List[Triangulation]:
+        """Enregistre puis triangule plusieurs PointSet.
+
+        Chaque ensemble enchaîne enregistrement et triangulation sans attendre
+        les autres : les deux étapes se recouvrent d'un ensemble à l'autre.
+        """
+
+        async def _pipeline(ps: PointSet) -> Triangulation:
+            return await self.get_triangulation(await self.register_point_set(ps))
+
+        return list(await asyncio.gather(*(_pipeline(ps) for ps in point_sets)))
+
+
+__all__ = ["APIClient", "AsyncAPIClient", "APIError", "DEFAULT_TIMEOUT"]
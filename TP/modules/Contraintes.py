@@ -0,0 +1,130 @@
+"""Contraintes
+`Contraintes` décrit les segments et polygones qu'une triangulation doit
+respecter. Comme pour `Triangles`, les sommets sont référencés par leur indice
+dans le `PointSet` triangulé.
+
+La représentation binaire se compose de trois parties:
+- Les segments contraints:
+  - 4 bytes (un `unsigned long`) donnant le nombre de segments
+  - 2 x 4 bytes par segment, les indices de ses deux extrémités
+- Le bord extérieur:
+  - 4 bytes (un `unsigned long`) donnant son nombre de sommets (0 : pas de bord)
+  - 4 bytes par sommet, son indice, dans l'ordre du polygone
+- Les trous:
+  - 4 bytes (un `unsigned long`) donnant le nombre de trous
+  - pour chaque trou, 4 bytes donnant son nombre de sommets puis 4 bytes par
+    sommet, comme pour le bord
+
+Les côtés du bord et des trous sont eux aussi des segments contraints ; les
+triangles hors du bord ou dans un trou sont retirés de la triangulation.
+"""
+
+import struct
+from typing import Iterable, List, Sequence, Tuple
+
+from TP.modules.Stockage import empreinte
+
+Segment = Tuple[int, int]
+
+
+class Contraintes:
+    """Segments contraints, bord extérieur et trous d'une triangulation."""
+
+    _COUNT_STRUCT = struct.Struct("<I")
+
+    def __init__(
+        self,
+        segments: Iterable[Segment] = (),
+        bord: Sequence[int] = (),
+        trous: Iterable[Sequence[int]] = (),
+    ):
+        self.segments: List[Segment] = [(int(a), int(b)) for a, b in segments]
+        self.bord: List[int] = [int(i) for i in bord]
+        self.trous: List[List[int]] = [[int(i) for i in t] for t in trous]
+
+    def polygones(self) -> List[List[int]]:
+        """Bord (s'il existe) puis trous."""
+        return ([self.bord] if self.bord else []) + self.trous
+
+    def aretes_polygones(self) -> List[Segment]:
+        """Côtés du bord et des trous (polygones fermés)."""
+        return [
+            (p[i], p[(i + 1) % len(p)]) for p in self.polygones() for i in range(len(p))
+        ]
+
+    def valider(self, nombre_points: int) -> None:
+        """Vérifie les indices et la taille des polygones.
+
+        Raises:
+            ValueError: si un indice est hors du PointSet ou si un polygone a
+                moins de 3 sommets.
+        """
+        for p in self.polygones():
+            if len(p) < 3:
+                raise ValueError("Un polygone doit avoir au moins 3 sommets")
+        indices = [i for s in self.segments for i in s] + [
+            i for p in self.polygones() for i in p
+        ]
+        if any(not 0 <= i < nombre_points for i in indices):
+            raise ValueError("Indice de sommet hors du PointSet")
+
+    def __bool__(self) -> bool:
+        return bool(self.segments or self.bord or self.trous)
+
+    def empreinte(self) -> str:
+        """Empreinte de la représentation binaire (clé de cache)."""
+        return empreinte(self.to_bytes())
+
+    # --- Sérialisation binaire ---
+    def to_bytes(self) -> bytes:
+        c = self._COUNT_STRUCT
+        out = bytearray(c.pack(len(self.segments)))
+        for a, b in self.segments:
+            out.extend(struct.pack("<II", a, b))
+        out.extend(c.pack(len(self.bord)))
+        out.extend(struct.pack(f"<{len(self.bord)}I", *self.bord))
+        out.extend(c.pack(len(self.trous)))
+        for t in self.trous:
+            out.extend(c.pack(len(t)))
+            out.extend(struct.pack(f"<{len(t)}I", *t))
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Contraintes":
+        pos = 0
+
+        def lire(nombre: int) -> Tuple[int, ...]:
+            nonlocal pos
+            fin = pos + 4 * nombre
+            if len(data) < fin:
+                raise ValueError("Données trop courtes")
+            valeurs = struct.unpack_from(f"<{nombre}I", data, pos)
+            pos = fin
+            return valeurs
+
+        (n_segments,) = lire(1)
+        brut = lire(2 * n_segments)
+        segments = list(zip(brut[0::2], brut[1::2], strict=True))
+        (n_bord,) = lire(1)
+        bord = lire(n_bord)
+        (n_trous,) = lire(1)
+        trous = []
+        for _ in range(n_trous):
+            (k,) = lire(1)
+            trous.append(lire(k))
+        if pos != len(data):
+            raise ValueError("Longueur incohérente")
+        return cls(segments, bord, trous)
+
+    @classmethod
+    def from_binary(cls, data: bytes) -> "Contraintes":
+        return cls.from_bytes(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"Contraintes({len(self.segments)} segments, "
+            f"bord de {len(self.bord)} sommets, {len(self.trous)} trous)"
+        )
+
+
+__all__ = ["Contraintes"]
@@ -0,0 +1,341 @@
+"""Delaunay
+Triangulation de Delaunay contrainte d'un `PointSet`.
+
+1. Les points sont insérés un à un (algorithme de Bowyer-Watson) dans un
+   super-triangle, dans un ordre qui suit l'espace pour que la recherche du
+   triangle contenant chaque point reste locale.
+2. Chaque segment contraint, puis chaque côté de l'enveloppe convexe, est
+   forcé en basculant les arêtes qu'il croise (méthode de Sloan), puis les
+   arêtes créées sont rebasculées tant qu'elles ne respectent pas le critère
+   de Delaunay. Forcer l'enveloppe évite de perdre des triangles du bord
+   quand le super-triangle est trop proche.
+3. Les triangles hors du bord ou dans un trou sont retirés par parcours en
+   largeur depuis l'extérieur : franchir un côté de polygone change de région.
+
+Le maillage est conservé sous forme d'arêtes orientées : `arete[(a, b)]` est le
+triangle qui parcourt a -> b dans le sens direct, son voisin de l'autre côté de
+cette arête est donc `arete[(b, a)]`.
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+from TP.modules.Contraintes import Contraintes
+from TP.modules.PointSet import PointSet
+from TP.modules.Triangulation import Triangulation
+
+Arete = Tuple[int, int]
+
+
+class _Maillage:
+    """Triangles (sens direct) indexés par leurs arêtes orientées."""
+
+    def __init__(self, xs: List[float], ys: List[float]):
+        self.xs = xs
+        self.ys = ys
+        self.tris: Dict[int, Tuple[int, int, int]] = {}
+        self.arete: Dict[Arete, int] = {}
+        self.sommet_tri: Dict[int, int] = {}  # un triangle vivant par sommet
+        self.contraintes: Set[frozenset] = set()
+        self._prochain = 0
+        self._dernier = -1
+
+    # --- Prédicats géométriques ---
+    def orient(self, a: int, b: int, c: int) -> float:
+        """> 0 si c est à gauche de a -> b, < 0 à droite, 0 si alignés."""
+        xs, ys = self.xs, self.ys
+        return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+    def dans_cercle(self, a: int, b: int, c: int, d: int) -> bool:
+        """d est-il strictement dans le cercle circonscrit de (a, b, c) direct ?"""
+        xs, ys = self.xs, self.ys
+        adx, ady = xs[a] - xs[d], ys[a] - ys[d]
+        bdx, bdy = xs[b] - xs[d], ys[b] - ys[d]
+        cdx, cdy = xs[c] - xs[d], ys[c] - ys[d]
+        return (
+            (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+            - (bdx * bdx + bdy * bdy) * (adx * cdy - cdx * ady)
+            + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+        ) > 0
+
+    # --- Structure ---
+    def ajouter(self, a: int, b: int, c: int) -> int:
+        t = self._prochain
+        self._prochain += 1
+        self.tris[t] = (a, b, c)
+        self.arete[(a, b)] = self.arete[(b, c)] = self.arete[(c, a)] = t
+        self.sommet_tri[a] = self.sommet_tri[b] = self.sommet_tri[c] = t
+        self._dernier = t
+        return t
+
+    def retirer(self, t: int) -> None:
+        a, b, c = self.tris.pop(t)
+        del self.arete[(a, b)], self.arete[(b, c)], self.arete[(c, a)]
+
+    def oppose(self, t: int, u: int, v: int) -> int:
+        """Sommet du triangle t qui n'est ni u ni v."""
+        for s in self.tris[t]:
+            if s != u and s != v:
+                return s
+        raise ValueError("Triangle dégénéré")
+
+    def basculer(self, u: int, v: int) -> Arete:
+        """Remplace l'arête u-v par l'autre diagonale du quadrilatère ; la retourne."""
+        c = self.oppose(self.arete[(u, v)], u, v)
+        d = self.oppose(self.arete[(v, u)], u, v)
+        self.retirer(self.arete[(u, v)])
+        self.retirer(self.arete[(v, u)])
+        self.ajouter(u, d, c)
+        self.ajouter(d, v, c)
+        return c, d
+
+    # --- Insertion des points (Bowyer-Watson) ---
+    def localiser(self, p: int) -> int:
+        """Triangle contenant p, par marche depuis le dernier triangle créé."""
+        t = self._dernier
+        for _ in range(len(self.tris) + 1):
+            a, b, c = self.tris[t]
+            for u, v in ((a, b), (b, c), (c, a)):
+                if self.orient(u, v, p) < 0:
+                    t = self.arete[(v, u)]
+                    break
+            else:
+                return t
+        # Marche en boucle (imprécision numérique) : recherche exhaustive
+        for t, (a, b, c) in self.tris.items():
+            if (
+                self.orient(a, b, p) >= 0
+                and self.orient(b, c, p) >= 0
+                and self.orient(c, a, p) >= 0
+            ):
+                return t
+        raise RuntimeError("Point hors du maillage")
+
+    def inserer_point(self, p: int) -> None:
+        depart = self.localiser(p)
+        cavite = {depart}
+        pile = [depart]
+        bord: List[Arete] = []
+        while pile:
+            a, b, c = self.tris[pile.pop()]
+            for u, v in ((a, b), (b, c), (c, a)):
+                n = self.arete.get((v, u))
+                if n in cavite:
+                    continue
+                if n is not None and self.dans_cercle(*self.tris[n], p):
+                    cavite.add(n)
+                    pile.append(n)
+                else:
+                    bord.append((u, v))
+        for t in cavite:
+            self.retirer(t)
+        for u, v in bord:
+            self.ajouter(u, v, p)
+
+    # --- Insertion des segments (Sloan) ---
+    def _premiere_croisee(self, a: int, b: int) -> Tuple[Arete | None, int | None]:
+        """Arête croisée par a -> b en quittant a, ou sommet aligné sur le segment."""
+        xs, ys = self.xs, self.ys
+        depart = t = self.sommet_tri[a]
+        while True:
+            i = self.tris[t].index(a)
+            x, y = self.tris[t][(i + 1) % 3], self.tris[t][(i + 2) % 3]
+            for s in (x, y):
+                if (
+                    self.orient(a, b, s) == 0
+                    and (xs[s] - xs[a]) * (xs[b] - xs[a])
+                    + (ys[s] - ys[a]) * (ys[b] - ys[a])
+                    > 0
+                ):
+                    return None, s
+            if self.orient(a, b, x) < 0 < self.orient(a, b, y):
+                return (x, y), None
+            t = self.arete[(a, y)]  # triangle suivant autour de a
+            if t == depart:
+                raise RuntimeError("Segment contraint introuvable")
+
+    def _aretes_croisees(self, a: int, b: int) -> Tuple[List[Arete], int | None]:
+        """Arêtes croisées par a -> b (droite, gauche), ou sommet aligné sur a -> b."""
+        arete, milieu = self._premiere_croisee(a, b)
+        if milieu is not None:
+            return [], milieu
+        croisees = [arete]
+        u, v = arete
+        while True:
+            if frozenset((u, v)) in self.contraintes:
+                raise ValueError("Segments contraints sécants")
+            w = self.oppose(self.arete[(v, u)], u, v)
+            if w == b:
+                return croisees, None
+            ow = self.orient(a, b, w)
+            if ow == 0:
+                return [], w
+            if ow < 0:
+                u = w
+            else:
+                v = w
+            croisees.append((u, v))
+
+    def inserer_segment(self, a: int, b: int) -> None:
+        segments = [(a, b)]
+        while segments:
+            a, b = segments.pop()
+            if a == b:
+                continue
+            if (a, b) not in self.arete and (b, a) not in self.arete:
+                croisees, milieu = self._aretes_croisees(a, b)
+                if milieu is not None:
+                    segments.append((a, milieu))
+                    segments.append((milieu, b))
+                    continue
+                self._forcer(a, b, croisees)
+            self.contraintes.add(frozenset((a, b)))
+
+    def _forcer(self, a: int, b: int, croisees: List[Arete]) -> None:
+        """Bascule les arêtes croisées par a-b jusqu'à faire apparaître a-b."""
+        file = deque(croisees)
+        nouvelles: List[Arete] = []
+        bloquees = 0
+        while file:
+            u, v = file.popleft()
+            c = self.oppose(self.arete[(u, v)], u, v)
+            d = self.oppose(self.arete[(v, u)], u, v)
+            if self.orient(c, d, u) * self.orient(c, d, v) >= 0:
+                # Quadrilatère non convexe : on y reviendra
+                file.append((u, v))
+                bloquees += 1
+                if bloquees > len(file):
+                    raise RuntimeError("Insertion du segment contraint impossible")
+                continue
+            bloquees = 0
+            c, d = self.basculer(u, v)
+            if (
+                c not in (a, b)
+                and d not in (a, b)
+                and self.orient(a, b, c) * self.orient(a, b, d) < 0
+            ):
+                file.append((c, d))
+            else:
+                nouvelles.append((c, d))
+        self.contraintes.add(frozenset((a, b)))
+        # Restauration du critère de Delaunay sur les arêtes créées
+        modifie = True
+        while modifie:
+            modifie = False
+            for i, (u, v) in enumerate(nouvelles):
+                if frozenset((u, v)) in self.contraintes or (u, v) not in self.arete:
+                    continue
+                t = self.arete[(u, v)]
+                c = self.oppose(t, u, v)
+                d = self.oppose(self.arete[(v, u)], u, v)
+                if (
+                    self.dans_cercle(u, v, c, d)
+                    and self.orient(c, d, u) * self.orient(c, d, v) < 0
+                ):
+                    nouvelles[i] = self.basculer(u, v)
+                    modifie = True
+
+    # --- Régions ---
+    def profondeurs(
+        self, depart: List[int], bords: Set[frozenset], initiale: int
+    ) -> Dict[int, int]:
+        """Nombre de côtés de polygones franchis depuis les triangles `depart`."""
+        profondeur: Dict[int, int] = {}
+        courant, d = depart, initiale
+        while courant:
+            suivant = []
+            pile = list(courant)
+            while pile:
+                t = pile.pop()
+                if t in profondeur:
+                    continue
+                profondeur[t] = d
+                a, b, c = self.tris[t]
+                for u, v in ((a, b), (b, c), (c, a)):
+                    n = self.arete.get((v, u))
+                    if n is None or n in profondeur:
+                        continue
+                    (suivant if frozenset((u, v)) in bords else pile).append(n)
+            courant, d = suivant, d + 1
+        return profondeur
+
+
+def _ordre_spatial(indices: List[int], xs: List[float], ys: List[float]) -> List[int]:
+    """Trie les points en bandes horizontales parcourues en serpentin."""
+    if not indices:
+        return indices
+    bandes = max(1, int(len(indices) ** 0.5 / 2))
+    y0 = min(ys[i] for i in indices)
+    hauteur = (max(ys[i] for i in indices) - y0) or 1.0
+
+    def cle(i: int) -> Tuple[int, float]:
+        bande = min(int((ys[i] - y0) / hauteur * bandes), bandes - 1)
+        return bande, xs[i] if bande % 2 == 0 else -xs[i]
+
+    return sorted(indices, key=cle)
+
+
+def trianguler(
+    point_set: PointSet, contraintes: Contraintes | None = None
+) -> Triangulation:
+    """Triangulation de Delaunay (contrainte si `contraintes` est fourni).
+
+    Les sommets du résultat sont ceux de `point_set`, dans le même ordre ; les
+    points en double sont tous rattachés à leur première occurrence.
+
+    Raises:
+        ValueError: si les contraintes sont invalides ou se croisent.
+        RuntimeError: si un segment n'a pas pu être inséré.
+    """
+    contraintes = contraintes or Contraintes()
+    coords = point_set.coordinates()
+    n = len(coords) // 2
+    contraintes.valider(n)
+    xs = list(coords[0::2])
+    ys = list(coords[1::2])
+    # Doublons : chaque point est rattaché à sa première occurrence
+    premier: Dict[Tuple[float, float], int] = {}
+    representant = [premier.setdefault((xs[i], ys[i]), i) for i in range(n)]
+    uniques = list(premier.values())
+    if len(uniques) < 3:
+        return Triangulation.from_indices(point_set, array("I"))
+    # Super-triangle englobant
+    x0, x1 = min(xs), max(xs)
+    y0, y1 = min(ys), max(ys)
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    d = max(x1 - x0, y1 - y0) or 1.0
+    xs.extend((cx - 20 * d, cx + 20 * d, cx))
+    ys.extend((cy - d, cy - d, cy + 20 * d))
+    m = _Maillage(xs, ys)
+    m.ajouter(n, n + 1, n + 2)
+    for p in _ordre_spatial(uniques, xs, ys):
+        m.inserer_point(p)
+    # Côtés des polygones d'abord (éventuellement découpés aux sommets alignés),
+    # qui délimitent les régions, puis les segments libres
+    for a, b in contraintes.aretes_polygones():
+        m.inserer_segment(representant[a], representant[b])
+    bords = set(m.contraintes)
+    for a, b in contraintes.segments:
+        m.inserer_segment(representant[a], representant[b])
+    enveloppe = [representant[i] for i in point_set.convex_hull()]
+    for i, a in enumerate(enveloppe):
+        m.inserer_segment(a, enveloppe[(i + 1) % len(enveloppe)])
+    # Régions : impair = intérieur (sans bord, on part de l'intérieur)
+    exterieurs = [t for t, tri in m.tris.items() if max(tri) >= n]
+    profondeur = (
+        m.profondeurs(exterieurs, bords, 0 if contraintes.bord else 1)
+        if contraintes.polygones()
+        else {}
+    )
+    indices = array("I")
+    for t, tri in m.tris.items():
+        if max(tri) >= n:
+            continue
+        if profondeur and profondeur.get(t, 0) % 2 == 0:
+            continue
+        indices.extend(tri)
+    return Triangulation.from_indices(point_set, indices)
+
+
+__all__ = ["trianguler"]
@@ -0,0 +1,126 @@
+"""Demarrage
+Outils pour le démarrage rapide des services.
+
+- `ModuleDiffere` : module importé seulement au premier accès à l'un de ses
+  attributs, pour ne pas payer au lancement d'un worker l'import de modules
+  dont il n'aura peut-être jamais besoin.
+- `rapport_imports` : coût d'import de chaque module (`python -X importtime`).
+- `mesurer_demarrage` : durées d'import et de préchauffage d'un module, dans
+  des processus neufs (démarrage à froid).
+"""
+
+import importlib
+import statistics
+import sys
+import threading
+from types import ModuleType
+from typing import Dict, List, Tuple
+
+
+class ModuleDiffere:
+    """Mandataire d'un module, importé au premier accès à un attribut.
+
+    Un attribut affecté sur le mandataire (par exemple par `monkeypatch`)
+    masque celui du module.
+    """
+
+    def __init__(self, nom: str):
+        object.__setattr__(self, "_nom", nom)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_verrou", threading.Lock())
+
+    def charger(self) -> ModuleType:
+        """Importe le module (une seule fois) et le retourne."""
+        module = self._module
+        if module is None:
+            with self._verrou:
+                module = self._module
+                if module is None:
+                    module = importlib.import_module(self._nom)
+                    object.__setattr__(self, "_module", module)
+        return module
+
+    def est_charge(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attribut: str):
+        return getattr(self.charger(), attribut)
+
+    def __repr__(self) -> str:
+        etat = "chargé" if self.est_charge() else "différé"
+        return f"ModuleDiffere({self._nom!r}, {etat})"
+
+
+def rapport_imports(module: str, nombre: int = 15) -> List[Tuple[str, int, int]]:
+    """Modules les plus coûteux à importer lors de l'import de `module`.
+
+    L'import a lieu dans un processus neuf, avec `-X importtime`.
+
+    Returns:
+        (module, temps propre, temps cumulé), en microsecondes, par temps
+        cumulé décroissant.
+    """
+    import subprocess
+
+    sortie = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    # Chaque module est listé après ses dépendances ; on ne garde que le bloc
+    # qui se termine par `module` lui-même, sans les imports de l'interpréteur
+    lignes, bloc = [], []
+    for ligne in sortie.splitlines():
+        if not ligne.startswith("import time:") or "self [us]" in ligne:
+            continue
+        propre, cumule, nom = ligne[len("import time:"):].split("|")
+        bloc.append((nom.strip(), int(propre), int(cumule)))
+        if not nom.startswith("  "):  # import de premier niveau
+            if nom.strip() == module:
+                lignes = bloc
+            bloc = []
+    lignes.sort(key=lambda ligne: ligne[2], reverse=True)
+    return lignes[:nombre]
+
+
+_SCRIPT_MESURE = """
+import time
+t0 = time.perf_counter()
+import {module} as m
+t1 = time.perf_counter()
+m.{prechauffage}()
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def mesurer_demarrage(
+    module: str, prechauffage: str, repetitions: int = 5
+) -> Dict[str, float]:
+    """Durées médianes (secondes) d'import de `module`, puis de `module.prechauffage()`.
+
+    Chaque mesure a lieu dans un processus neuf.
+    """
+    import subprocess
+
+    imports, prechauffages = [], []
+    script = _SCRIPT_MESURE.format(module=module, prechauffage=prechauffage)
+    for _ in range(repetitions):
+        sortie = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        t_import, t_prechauffage = map(float, sortie.split()[-2:])
+        imports.append(t_import)
+        prechauffages.append(t_prechauffage)
+    return {
+        "import": statistics.median(imports),
+        "warmUp": statistics.median(prechauffages),
+        "total": statistics.median(
+            a + b for a, b in zip(imports, prechauffages, strict=True)
+        ),
+    }
+
+
+__all__ = ["ModuleDiffere", "rapport_imports", "mesurer_demarrage"]
@@ -0,0 +1,190 @@
+"""Flux
+Lecture et écriture par lots du format binaire `PointSet` (voir `PointSet`),
+à mémoire constante, sur tout objet fichier : fichier, tube, flux de réponse
+HTTP (`response.raw` d'une requête `stream=True`)...
+
+- `LecteurPointSet` lit l'en-tête, puis produit les coordonnées par lots de
+  `taille_lot` points, chacun dans un `array('f')` x0, y0, x1, y1, ...
+- `EcrivainPointSet` écrit des lots au même format. Le nombre de points de
+  l'en-tête est :
+  - écrit d'emblée s'il est connu (il est alors vérifié à la fermeture)
+  - sinon réservé puis corrigé à la fermeture, si la destination est
+    positionnable (`seek`)
+  - sinon, les lots transitent par un fichier temporaire (en mémoire jusqu'à
+    `TAMPON_MEMOIRE` octets), recopié derrière l'en-tête à la fermeture
+"""
+
+import io
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import BinaryIO, Callable, Iterator
+
+from TP.modules.PointSet import PointSet, _ecrire_tableau, _lire_tableau
+
+# Nombre de points par lot par défaut (512 Kio de coordonnées)
+TAILLE_LOT = 65536
+# Au-delà, le tampon d'un écrivain sans nombre ni `seek` passe sur disque
+TAMPON_MEMOIRE = 8 * 1024 * 1024
+
+_COUNT_STRUCT = struct.Struct("<I")
+
+
+def _positionnable(flux: BinaryIO) -> bool:
+    try:
+        return bool(flux.seekable())
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return False
+
+
+class LecteurPointSet:
+    """Lecture par lots d'un PointSet binaire."""
+
+    def __init__(self, flux: BinaryIO, taille_lot: int = TAILLE_LOT):
+        """
+        Args:
+            flux: objet fichier binaire (seule sa méthode `read` est requise)
+            taille_lot: nombre maximal de points par lot
+
+        Raises:
+            ValueError: si l'en-tête est incomplet.
+        """
+        if taille_lot < 1:
+            raise ValueError("taille_lot doit être >= 1")
+        self._flux = flux
+        self.taille_lot = taille_lot
+        self.nombre = PointSet.lire_entete(flux)  # nombre de points annoncé
+        self._restants = self.nombre
+
+    def __iter__(self) -> Iterator[array]:
+        """Lots successifs de coordonnées.
+
+        Raises:
+            ValueError: si le flux est tronqué ou se poursuit après le dernier point.
+        """
+        while self._restants:
+            k = min(self.taille_lot, self._restants)
+            lot = _lire_tableau(self._flux, "f", 2 * k)
+            self._restants -= k
+            yield lot
+        if self._flux.read(1):
+            raise ValueError("Longueur incohérente avec le nombre de points")
+
+
+def lire_par_lots(flux: BinaryIO, taille_lot: int = TAILLE_LOT) -> Iterator[array]:
+    """Lots de coordonnées d'un PointSet binaire (voir `LecteurPointSet`)."""
+    return iter(LecteurPointSet(flux, taille_lot))
+
+
+class EcrivainPointSet:
+    """Écriture par lots d'un PointSet binaire, à utiliser avec `with`."""
+
+    def __init__(self, flux: BinaryIO, nombre: int | None = None):
+        """
+        Args:
+            flux: objet fichier binaire ouvert en écriture
+            nombre: nombre total de points, s'il est connu d'avance
+        """
+        self._flux = flux
+        self.nombre = nombre
+        self.ecrits = 0
+        self._position: int | None = None
+        self._tampon = None
+        self._ferme = False
+        if nombre is not None:
+            flux.write(_COUNT_STRUCT.pack(nombre))
+        elif _positionnable(flux):
+            self._position = flux.tell()
+            flux.write(_COUNT_STRUCT.pack(0))  # corrigé à la fermeture
+        else:
+            # Fermé par `fermer` ou `__exit__`, pas dans un `with` local
+            self._tampon = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+                max_size=TAMPON_MEMOIRE
+            )
+
+    def ecrire(self, lot) -> None:
+        """Écrit un lot de coordonnées x0, y0, x1, y1, ...
+
+        `lot` est un `array('f')`, une vue de format 'f' ou un itérable de nombres.
+
+        Raises:
+            ValueError: si le lot est invalide ou dépasse le nombre annoncé.
+        """
+        if self._ferme:
+            raise ValueError("Écrivain fermé")
+        if not isinstance(lot, (array, memoryview)):
+            lot = array("f", lot)
+        format_lot = lot.typecode if isinstance(lot, array) else lot.format
+        if format_lot != "f" or len(lot) % 2:
+            raise ValueError("Lot de coordonnées invalide")
+        total = self.ecrits + len(lot) // 2
+        if total > (self.nombre if self.nombre is not None else 0xFFFFFFFF):
+            raise ValueError("Plus de points que le nombre annoncé")
+        _ecrire_tableau(self._tampon or self._flux, lot)
+        self.ecrits = total
+
+    def fermer(self) -> None:
+        """Termine l'en-tête (ou vérifie le nombre annoncé).
+
+        Raises:
+            ValueError: si le nombre de points écrits diffère du nombre annoncé.
+        """
+        if self._ferme:
+            return
+        self._ferme = True
+        if self.nombre is not None:
+            if self.ecrits != self.nombre:
+                raise ValueError("Nombre de points écrits différent du nombre annoncé")
+        elif self._position is not None:
+            fin = self._flux.tell()
+            self._flux.seek(self._position)
+            self._flux.write(_COUNT_STRUCT.pack(self.ecrits))
+            self._flux.seek(fin)
+        else:
+            self._flux.write(_COUNT_STRUCT.pack(self.ecrits))
+            self._tampon.seek(0)
+            shutil.copyfileobj(self._tampon, self._flux, 1 << 20)
+            self._tampon.close()
+
+    def __enter__(self) -> "EcrivainPointSet":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.fermer()
+        else:
+            # Écriture interrompue : la destination n'est pas complétée
+            self._ferme = True
+            if self._tampon is not None:
+                self._tampon.close()
+
+
+def traiter_par_lots(
+    source: BinaryIO,
+    destination: BinaryIO,
+    fonction: Callable[[array], object] | None = None,
+    taille_lot: int = TAILLE_LOT,
+) -> int:
+    """Recopie un PointSet binaire lot par lot, en appliquant `fonction` à chaque lot.
+
+    `fonction` retourne le lot à écrire, éventuellement plus court (filtrage).
+
+    Returns:
+        Nombre de points écrits.
+    """
+    lecteur = LecteurPointSet(source, taille_lot)
+    nombre = lecteur.nombre if fonction is None else None
+    with EcrivainPointSet(destination, nombre) as ecrivain:
+        for lot in lecteur:
+            ecrivain.ecrire(lot if fonction is None else fonction(lot))
+    return ecrivain.ecrits
+
+
+__all__ = [
+    "LecteurPointSet",
+    "EcrivainPointSet",
+    "lire_par_lots",
+    "traiter_par_lots",
+    "TAILLE_LOT",
+]
@@ -9,21 +9,176 @@ Les 4 premiers bytes sont la coordonnée X (un `float`) et les 4 bytes suivant
 la coordonnée Y (un `float` aussi).
 """
 
-from typing import Iterable, List
+import math
+import mmap
+import os
+import secrets
 import struct
+import sys
+from array import array
+from itertools import chain, islice
+from typing import BinaryIO, Iterable, List, Sequence
+
 from Point import Point
 
+# Le format binaire est little-endian, `array` travaille en ordre natif.
+_NATIF_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _lire_dans(flux: BinaryIO, tampon: memoryview) -> None:
+    """Remplit `tampon` depuis un flux binaire, sans copie intermédiaire.
+
+    Raises:
+        ValueError: si le flux se termine avant que le tampon soit plein.
+    """
+    pos, total = 0, len(tampon)
+    readinto = getattr(flux, "readinto", None)
+    while pos < total:
+        if readinto is not None:
+            n = readinto(tampon[pos:])
+        else:
+            morceau = flux.read(total - pos)
+            n = len(morceau) if morceau else 0
+            tampon[pos:pos + n] = morceau
+        if not n:
+            raise ValueError("Données incomplètes")
+        pos += n
+
+
+def _lire_tableau(flux: BinaryIO, typecode: str, nombre: int) -> array:
+    """Lit `nombre` éléments little-endian d'un flux dans un `array`."""
+    tab = array(typecode, [0]) * nombre
+    if nombre:
+        _lire_dans(flux, memoryview(tab).cast("B"))
+    if not _NATIF_LITTLE_ENDIAN:
+        tab.byteswap()
+    return tab
+
+
+def _octets_tableau(tab: array) -> bytes:
+    """Octets little-endian d'un `array` (copie seulement si big-endian)."""
+    if _NATIF_LITTLE_ENDIAN:
+        return tab.tobytes()
+    tab = array(tab.typecode, tab)
+    tab.byteswap()
+    return tab.tobytes()
+
+
+def _ecrire_tableau(flux: BinaryIO, tab) -> None:
+    """Écrit un `array` (ou une vue) en little-endian, sans copie si possible."""
+    if _NATIF_LITTLE_ENDIAN:
+        flux.write(memoryview(tab).cast("B"))
+    else:
+        tab = array(tab.typecode if isinstance(tab, array) else tab.format, tab)
+        tab.byteswap()
+        flux.write(tab)
+
+
+def _projeter(file_path: str) -> mmap.mmap:
+    """Projette un fichier en mémoire, en lecture seule.
+
+    Raises:
+        ValueError: si le fichier est vide (il ne peut pas être projeté).
+    """
+    with open(file_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            raise ValueError("Données trop courtes")
+        # La projection reste valide après la fermeture du fichier
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _fermer_projection(projection: mmap.mmap | None, *vues) -> None:
+    """Libère les vues `memoryview` parmi `vues`, puis ferme la projection.
+
+    Raises:
+        BufferError: si une autre vue sur la projection est encore utilisée.
+    """
+    for vue in vues:
+        if isinstance(vue, memoryview):
+            vue.release()
+    if projection is not None:
+        projection.close()
+
+
+def _enregistrer(file_path: str, ecrire) -> None:
+    """Écrit un fichier via `ecrire(flux)`, à travers un tampon d'écriture.
+
+    Le fichier est écrit à côté, sous un nom temporaire unique (enregistrements
+    simultanés), puis renommé : une projection en mémoire de l'ancien contenu
+    (par `load`) reste valide. Sous Windows, un fichier projeté ne peut pas
+    être remplacé : fermer (`close`) l'objet chargé avant d'enregistrer dessus.
+    """
+    # Permissions usuelles (0o666 moins l'umask), comme un `open(..., "wb")`
+    temporaire = f"{file_path}.{secrets.token_hex(8)}.tmp"
+    drapeaux = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(temporaire, drapeaux, 0o666)
+    try:
+        with open(fd, "wb", buffering=1 << 20) as f:
+            ecrire(f)
+        os.replace(temporaire, file_path)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+
 
 class PointSet:
+    """Ensemble de points 2D.
+
+    Deux représentations internes:
+     - une liste d'objets `Point` (construction, ajout/retrait)
+     - un tableau `array('f')` contigu de coordonnées x0, y0, x1, y1, ...
+       (décodage binaire), les `Point` n'étant créés qu'au premier accès ;
+       pour un fichier projeté en mémoire (`load`), une vue `memoryview` en
+       lecture seule sur le fichier, copiée seulement avant une modification
+    """
+
     _COUNT_STRUCT = struct.Struct("<I")
     _POINT_STRUCT = struct.Struct("<ff")
 
     def __init__(self, points: Iterable[Point] | None = None):
-        self._points: List[Point] = []
+        self._points: List[Point] | None = []
+        self._coords: array | None = None
+        self._projection: mmap.mmap | None = None  # fichier projeté par `load`
         if points:
             for p in points:
                 self.add(p)
 
+    @classmethod
+    def from_array(cls, coords: array) -> "PointSet":
+        """Construit un ensemble adossé à un tableau `array('f')` x0, y0, x1, y1, ...
+
+        Le tableau n'est pas copié.
+        """
+        if coords.typecode != "f" or len(coords) % 2:
+            raise ValueError("Tableau de coordonnées invalide")
+        obj = cls()
+        obj._points = None
+        obj._coords = coords
+        return obj
+
+    def _liste(self) -> List[Point]:
+        """Liste des `Point`, créée à partir du tableau si besoin.
+
+        Les `Point` étant mutables, la liste devient la seule référence.
+        """
+        if self._points is None:
+            c = self._coords
+            self._points = [Point(c[i], c[i + 1]) for i in range(0, len(c), 2)]
+            self._coords = None
+        return self._points
+
+    def coordinates(self) -> array:
+        """Coordonnées entrelacées x0, y0, x1, y1, ... dans un `array('f')`.
+
+        Pour un ensemble chargé par `load`, vue en lecture seule sur le fichier.
+        """
+        if self._points is None:
+            return self._coords
+        return array(
+            "f", chain.from_iterable((p.get_x(), p.get_y()) for p in self._points)
+        )
+
     # --- Méthodes de collection ---
     def add(self, point: Point) -> None:
         """Ajoute un point à l'ensemble.
@@ -33,40 +188,49 @@ class PointSet:
         """
         if not isinstance(point, Point):
             raise TypeError("Seuls des objets Point peuvent être ajoutés")
-        self._points.append(point)
+        self._liste().append(point)
 
     def remove(self, point: Point) -> None:
         """Retire un point existant. ValueError si absent."""
         try:
-            self._points.remove(point)
+            self._liste().remove(point)
         except ValueError as e:
             raise ValueError("Le point n'est pas présent dans l'ensemble") from e
 
     def clear(self) -> None:
         """Vide l'ensemble."""
-        self._points.clear()
+        self._points = []
+        self._coords = None
 
     def __len__(self) -> int:  # permet len(point_set)
+        if self._points is None:
+            return len(self._coords) // 2
         return len(self._points)
 
     def size(self) -> int:
         """Nombre de points."""
-        return len(self._points)
+        return len(self)
 
     def __iter__(self):  # iteration sur les points
-        return iter(self._points)
+        return iter(self._liste())
 
     def __getitem__(self, idx: int) -> Point:
-        return self._points[idx]
+        return self._liste()[idx]
+
+    def get_point(self, idx: int) -> Point:
+        """Point d'indice `idx` (attendu par client_test)."""
+        return self[idx]
 
     def __contains__(self, item: Point) -> bool:
-        return item in self._points
+        return item in self._liste()
 
     def to_list(self) -> List[Point]:
-        return list(self._points)
+        return list(self._liste())
 
     # --- Sérialisation binaire ---
     def to_bytes(self) -> bytes:
+        if self._points is None:
+            return self._COUNT_STRUCT.pack(len(self)) + _octets_tableau(self._coords)
         count = len(self._points)
         out = bytearray(self._COUNT_STRUCT.pack(count))
         for p in self._points:
@@ -81,41 +245,285 @@ class PointSet:
         attendu = cls._COUNT_STRUCT.size + count * cls._POINT_STRUCT.size
         if len(data) != attendu:
             raise ValueError("Longueur incohérente avec le nombre de points")
-        points: List[Point] = []
-        pos = cls._COUNT_STRUCT.size
-        for _ in range(count):
-            x, y = cls._POINT_STRUCT.unpack_from(data, pos)
-            points.append(Point(x, y))
-            pos += cls._POINT_STRUCT.size
-        return cls(points)
+        coords = array("f")
+        coords.frombytes(memoryview(data)[cls._COUNT_STRUCT.size :])
+        if not _NATIF_LITTLE_ENDIAN:
+            coords.byteswap()
+        return cls.from_array(coords)
 
     # Alias attendu par client_test.py
     @classmethod
     def from_binary(cls, data: bytes) -> "PointSet":
         return cls.from_bytes(data)
 
+    @classmethod
+    def tranche_binaire(
+        cls, data: bytes, offset: int = 0, count: int | None = None
+    ) -> bytes:
+        """Points [offset, offset + count) au format binaire, extraits sans décodage.
+
+        Seul l'en-tête est lu ; la tranche est bornée au nombre de points.
+
+        Raises:
+            ValueError: si les données sont trop courtes ou offset/count négatifs.
+        """
+        if offset < 0 or (count is not None and count < 0):
+            raise ValueError("offset et count doivent être positifs")
+        if len(data) < cls._COUNT_STRUCT.size:
+            raise ValueError("Données trop courtes")
+        (n,) = cls._COUNT_STRUCT.unpack_from(data, 0)
+        debut = min(offset, n)
+        fin = n if count is None else min(n, debut + count)
+        pos = cls._COUNT_STRUCT.size
+        taille = cls._POINT_STRUCT.size
+        vue = memoryview(data)[pos + debut * taille : pos + fin * taille]
+        return cls._COUNT_STRUCT.pack(fin - debut) + vue
+
+    @classmethod
+    def from_buffer(cls, data) -> "PointSet":
+        """Ensemble adossé à un tampon binaire (bytes, mmap...), sans copie.
+
+        Seuls l'en-tête et la longueur sont vérifiés ; les coordonnées sont
+        une vue `memoryview` en lecture seule sur le tampon.
+        """
+        vue = memoryview(data).cast("B")
+        try:
+            if len(vue) < cls._COUNT_STRUCT.size:
+                raise ValueError("Données trop courtes")
+            (count,) = cls._COUNT_STRUCT.unpack_from(vue, 0)
+            if len(vue) != cls.taille_binaire(count):
+                raise ValueError("Longueur incohérente avec le nombre de points")
+        except ValueError:
+            vue.release()  # le tampon (projection de `load`) reste refermable
+            raise
+        if not _NATIF_LITTLE_ENDIAN:
+            return cls.from_bytes(vue)
+        obj = cls()
+        obj._points = None
+        obj._coords = vue[cls._COUNT_STRUCT.size :].toreadonly().cast("f")
+        return obj
+
+    @classmethod
+    def taille_binaire(cls, count: int) -> int:
+        """Taille en octets d'un PointSet binaire de `count` points."""
+        return cls._COUNT_STRUCT.size + count * cls._POINT_STRUCT.size
+
+    @classmethod
+    def lire_entete(cls, flux: BinaryIO) -> int:
+        """Lit l'en-tête d'un PointSet binaire et retourne le nombre de points annoncé.
+
+        Seuls les 4 premiers octets du flux sont consommés : le nombre de
+        points peut être contrôlé avant de lire les coordonnées.
+        """
+        entete = bytearray(cls._COUNT_STRUCT.size)
+        try:
+            _lire_dans(flux, memoryview(entete))
+        except ValueError as e:
+            raise ValueError("Données trop courtes") from e
+        (count,) = cls._COUNT_STRUCT.unpack(entete)
+        return count
+
+    @classmethod
+    def _lire_flux(cls, flux: BinaryIO, count: int | None = None) -> "PointSet":
+        """Lit un PointSet en tête de flux, sans vérifier la fin du flux."""
+        if count is None:
+            count = cls.lire_entete(flux)
+        return cls.from_array(_lire_tableau(flux, "f", 2 * count))
+
+    @classmethod
+    def from_stream(cls, flux: BinaryIO, count: int | None = None) -> "PointSet":
+        """Décode un PointSet depuis un objet fichier (ou flux de réponse HTTP).
+
+        Les coordonnées sont lues directement dans le tableau final, sans
+        constituer d'abord la totalité des octets en mémoire. Si `count` est
+        fourni, l'en-tête a déjà été lu (par `lire_entete`).
+        """
+        ps = cls._lire_flux(flux, count)
+        if flux.read(1):
+            raise ValueError("Longueur incohérente avec le nombre de points")
+        return ps
+
+    def ecrire(self, flux: BinaryIO) -> None:
+        """Écrit le format binaire dans un flux, sans constituer tous les octets."""
+        flux.write(self._COUNT_STRUCT.pack(len(self)))
+        if self._points is None:
+            _ecrire_tableau(flux, self._coords)
+            return
+        points = iter(self._points)
+        while lot := list(islice(points, 4096)):
+            flux.write(
+                struct.pack(
+                    f"<{2 * len(lot)}f",
+                    *chain.from_iterable((p.get_x(), p.get_y()) for p in lot),
+                )
+            )
+
     def save(self, file_path: str) -> None:
-        with open(file_path, "wb") as f:
-            f.write(self.to_bytes())
+        _enregistrer(file_path, self.ecrire)
 
     @classmethod
     def load(cls, file_path: str) -> "PointSet":
-        with open(file_path, "rb") as f:
-            return cls.from_bytes(f.read())
+        """Ensemble adossé au fichier projeté en mémoire (voir `from_buffer`).
 
-    # --- Utilitaire simple ---
-    def bounding_box(self) -> tuple[float, float, float, float] | None:
-        if not self._points:
+        Le fichier n'est pas lu : seules les pages accédées sont chargées, il
+        peut donc dépasser la mémoire disponible. La projection est libérée
+        par `close`, ou en sortie de `with`.
+        """
+        projection = _projeter(file_path)
+        try:
+            obj = cls.from_buffer(projection)
+        except BaseException:
+            # Sinon fichier verrouillé (Windows) jusqu'au ramasse-miettes
+            projection.close()
+            raise
+        obj._projection = projection
+        return obj
+
+    def close(self) -> None:
+        """Libère la projection en mémoire d'un ensemble chargé par `load`.
+
+        Sans effet sur un autre ensemble. Un ensemble encore adossé au fichier
+        n'est plus utilisable ensuite.
+
+        Raises:
+            BufferError: si une vue obtenue par `coordinates` est encore utilisée.
+        """
+        if self._projection is not None:
+            _fermer_projection(self._projection, self._coords)
+            self._projection = None
+
+    def __enter__(self) -> "PointSet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Géométrie en bloc (sur le tableau de coordonnées) ---
+    def _abscisses_ordonnees(self) -> tuple[Sequence[float], Sequence[float]]:
+        """X et Y des points, extraits une seule fois.
+
+        Ensemble de `Point` : valeurs exactes des points, sans arrondi float32 ;
+        ensemble par tableau : tranches compactes du tableau.
+        """
+        if self._points is not None:
+            return [p.get_x() for p in self._points], [p.get_y() for p in self._points]
+        c = self._coords
+        return c[0::2], c[1::2]
+
+    def bbox_and_centroid(
+        self,
+    ) -> tuple[tuple[float, float, float, float], tuple[float, float]] | None:
+        """Boîte englobante (minX, minY, maxX, maxY) et centroïde des points.
+
+        Les X et les Y sont extraits une seule fois, puis réduits par
+        min/max/sum (voir `_abscisses_ordonnees`).
+        """
+        n = len(self)
+        if not n:
             return None
-        xs = [p.get_x() for p in self._points]
-        ys = [p.get_y() for p in self._points]
-        return min(xs), min(ys), max(xs), max(ys)
+        xs, ys = self._abscisses_ordonnees()
+        return (min(xs), min(ys), max(xs), max(ys)), (sum(xs) / n, sum(ys) / n)
+
+    def bounding_box(self) -> tuple[float, float, float, float] | None:
+        emprise = self.bbox_and_centroid()
+        return emprise[0] if emprise else None
+
+    def centroid(self) -> tuple[float, float] | None:
+        """Moyenne des points (None si l'ensemble est vide)."""
+        emprise = self.bbox_and_centroid()
+        return emprise[1] if emprise else None
+
+    def convex_hull(self) -> array:
+        """Indices des sommets de l'enveloppe convexe, dans le sens direct.
+
+        Chaîne monotone d'Andrew, O(n log n) : les points alignés sur un côté
+        et les doublons ne font pas partie du résultat.
+        """
+        xs, ys = self._abscisses_ordonnees()
+        ordre = sorted(range(len(xs)), key=lambda i: (xs[i], ys[i]))
+
+        def chaine(suite) -> List[int]:
+            out: List[int] = []
+            for p in suite:
+                while len(out) >= 2:
+                    a, b = out[-2], out[-1]
+                    if (xs[b] - xs[a]) * (ys[p] - ys[a]) - (ys[b] - ys[a]) * (
+                        xs[p] - xs[a]
+                    ) > 0:
+                        break
+                    out.pop()
+                out.append(p)
+            return out
+
+        if len(ordre) < 2:
+            return array("I", ordre)
+        enveloppe = chaine(ordre)[:-1] + chaine(reversed(ordre))[:-1]
+        if len(enveloppe) == 2 and (xs[enveloppe[0]], ys[enveloppe[0]]) == (
+            xs[enveloppe[1]],
+            ys[enveloppe[1]],
+        ):
+            del enveloppe[1]  # tous les points sont confondus
+        return array("I", enveloppe)
+
+    def _tableau_modifiable(self) -> array:
+        """Tableau des coordonnées, copié d'abord s'il est une vue en lecture seule."""
+        if not isinstance(self._coords, array):
+            self._coords = array("f", self._coords)
+        return self._coords
+
+    def _affine(
+        self, a: float, b: float, c: float, d: float, e: float, f: float
+    ) -> None:
+        """Applique en place (x, y) -> (a x + b y + e, c x + d y + f)."""
+        if self._points is not None:
+            for p in self._points:
+                x, y = p.get_x(), p.get_y()
+                p.set_x(a * x + b * y + e)
+                p.set_y(c * x + d * y + f)
+            return
+        coords = self._tableau_modifiable()
+        xs, ys = coords[0::2], coords[1::2]
+        # Le tableau est modifié sur place : les triangulations qui le partagent suivent
+        coords[0::2] = array(
+            "f", [a * x + b * y + e for x, y in zip(xs, ys, strict=True)]
+        )
+        coords[1::2] = array(
+            "f", [c * x + d * y + f for x, y in zip(xs, ys, strict=True)]
+        )
+
+    def translate(self, dx: float, dy: float) -> None:
+        """Translate tous les points, en place."""
+        if self._points is None:
+            coords = self._tableau_modifiable()
+            coords[0::2] = array("f", [x + dx for x in coords[0::2]])
+            coords[1::2] = array("f", [y + dy for y in coords[1::2]])
+        else:
+            self._affine(1.0, 0.0, 0.0, 1.0, dx, dy)
+
+    def scale(
+        self,
+        sx: float,
+        sy: float | None = None,
+        origin: tuple[float, float] = (0.0, 0.0),
+    ) -> None:
+        """Homothétie (affinité si `sy` diffère de `sx`) de centre `origin`."""
+        sy = sx if sy is None else sy
+        ox, oy = origin
+        self._affine(sx, 0.0, 0.0, sy, ox - sx * ox, oy - sy * oy)
+
+    def rotate(self, angle: float, origin: tuple[float, float] = (0.0, 0.0)) -> None:
+        """Rotation d'`angle` radians (sens direct) autour de `origin`, en place."""
+        cos, sin = math.cos(angle), math.sin(angle)
+        ox, oy = origin
+        self._affine(
+            cos, -sin, sin, cos, ox - cos * ox + sin * oy, oy - sin * ox - cos * oy
+        )
 
     def __repr__(self) -> str:  # aide au debug
         return f"PointSet({len(self)} points)"
 
     def __str__(self) -> str:
-        return ", ".join(f"({p.get_x()},{p.get_y()})" for p in self._points)
+        return ", ".join(f"({p.get_x()},{p.get_y()})" for p in self._liste())
 
 
 __all__ = ["PointSet"]
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""Stockage
+Stockage en mémoire des services.
+
+- `StockageContenu` : stockage adressé par contenu des `PointSet` du
+  `PointSetManager`. Chaque blob est identifié par son empreinte SHA-256 et
+  n'est conservé qu'une fois, quel que soit le nombre d'UUID qui y font
+  référence (compteur de références). Des métadonnées calculées une fois à
+  l'ingestion (nombre de points, boîte englobante...) accompagnent chaque blob,
+  ainsi que des valeurs dérivées plus coûteuses (enveloppe convexe...),
+  calculées à la première demande.
+- `CacheLRU` : cache borné, utilisé par le `Triangulator` pour réutiliser les
+  résultats d'une triangulation entre les UUID qui partagent un même contenu.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def empreinte(data: bytes) -> str:
+    """Empreinte (SHA-256, hexadécimale) d'un blob."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class StockageContenu:
+    """Blobs dédupliqués par empreinte, référencés par plusieurs identifiants."""
+
+    def __init__(self):
+        self._blobs: Dict[str, bytes] = {}
+        self._metadonnees: Dict[str, dict] = {}
+        self._derives: Dict[str, dict] = {}
+        self._references: Dict[str, int] = {}
+        self._ids: Dict[str, str] = {}  # identifiant -> empreinte
+        self._verrou = threading.Lock()
+
+    def ajouter(
+        self, identifiant: str, data: bytes, metadonnees: dict | None = None
+    ) -> str:
+        """Associe `data` à `identifiant` et retourne l'empreinte du contenu.
+
+        Les `metadonnees` ne sont conservées qu'à la première occurrence du contenu.
+
+        Raises:
+            KeyError: si l'identifiant est déjà utilisé.
+        """
+        h = empreinte(data)
+        with self._verrou:
+            if identifiant in self._ids:
+                raise KeyError(identifiant)
+            if h in self._blobs:
+                self._references[h] += 1
+            else:
+                self._blobs[h] = bytes(data)
+                self._metadonnees[h] = dict(metadonnees or {})
+                self._derives[h] = {}
+                self._references[h] = 1
+            self._ids[identifiant] = h
+        return h
+
+    def retirer(self, identifiant: str) -> bool:
+        """Retire un identifiant ; le blob est libéré avec sa dernière référence.
+
+        Returns:
+            False si l'identifiant était inconnu.
+        """
+        with self._verrou:
+            h = self._ids.pop(identifiant, None)
+            if h is None:
+                return False
+            self._references[h] -= 1
+            if not self._references[h]:
+                del self._references[h]
+                del self._blobs[h]
+                del self._metadonnees[h]
+                del self._derives[h]
+        return True
+
+    def get(self, identifiant: str) -> bytes | None:
+        """Contenu associé à un identifiant (None si inconnu)."""
+        entree = self.get_avec_empreinte(identifiant)
+        return entree[1] if entree else None
+
+    def get_avec_empreinte(self, identifiant: str) -> Tuple[str, bytes] | None:
+        """Couple (empreinte, contenu) d'un identifiant (None si inconnu)."""
+        with self._verrou:
+            h = self._ids.get(identifiant)
+            if h is None:
+                return None
+            return h, self._blobs[h]
+
+    def metadonnees(self, identifiant: str) -> dict | None:
+        """Métadonnées du contenu d'un identifiant (None si inconnu)."""
+        with self._verrou:
+            h = self._ids.get(identifiant)
+            return None if h is None else self._metadonnees[h]
+
+    def derive(
+        self, identifiant: str, cle: str, calcul: Callable[[bytes], object]
+    ) -> object:
+        """Valeur dérivée `cle` du contenu d'un identifiant, calculée au premier appel.
+
+        `calcul` reçoit le blob ; il est appelé hors verrou et son résultat est
+        conservé avec le contenu, pour tous les identifiants qui le partagent.
+
+        Raises:
+            KeyError: si l'identifiant est inconnu.
+        """
+        with self._verrou:
+            h = self._ids[identifiant]
+            if cle in self._derives[h]:
+                return self._derives[h][cle]
+            data = self._blobs[h]
+        valeur = calcul(data)
+        with self._verrou:
+            # Le contenu a pu être retiré pendant le calcul
+            if h in self._derives:
+                valeur = self._derives[h].setdefault(cle, valeur)
+        return valeur
+
+    def empreinte(self, identifiant: str) -> str | None:
+        """Empreinte du contenu d'un identifiant (None si inconnu)."""
+        return self._ids.get(identifiant)
+
+    def references(self, h: str) -> int:
+        """Nombre d'identifiants partageant le contenu d'empreinte `h`."""
+        return self._references.get(h, 0)
+
+    def __contains__(self, identifiant: str) -> bool:
+        return identifiant in self._ids
+
+    def __len__(self) -> int:  # nombre d'identifiants
+        return len(self._ids)
+
+    def nombre_blobs(self) -> int:
+        """Nombre de contenus distincts réellement stockés."""
+        return len(self._blobs)
+
+    def octets(self) -> int:
+        """Taille totale des contenus distincts stockés."""
+        with self._verrou:
+            return sum(len(b) for b in self._blobs.values())
+
+
+class CacheLRU(Generic[K, V]):
+    """Cache LRU borné, thread-safe.
+
+    La capacité est exprimée dans l'unité de `taille` (par défaut `len` des
+    valeurs, donc en octets pour des `bytes`) ; utiliser `taille=lambda v: 1`
+    pour borner le nombre d'entrées.
+    """
+
+    def __init__(self, capacite: int, taille: Callable[[V], int] = len):
+        self.capacite = capacite
+        self._taille = taille
+        self._entrees: "OrderedDict[K, V]" = OrderedDict()
+        self._occupe = 0
+        self._verrou = threading.Lock()
+
+    def get(self, cle: K) -> V | None:
+        """Valeur associée à `cle` (None si absente), marquée récemment utilisée."""
+        with self._verrou:
+            valeur = self._entrees.get(cle)
+            if valeur is not None:
+                self._entrees.move_to_end(cle)
+            return valeur
+
+    def put(self, cle: K, valeur: V) -> None:
+        """Ajoute une valeur, en évinçant les moins récemment utilisées.
+
+        Une valeur plus grande que la capacité n'est pas mise en cache.
+        """
+        t = self._taille(valeur)
+        if t > self.capacite:
+            return
+        with self._verrou:
+            ancienne = self._entrees.pop(cle, None)
+            if ancienne is not None:
+                self._occupe -= self._taille(ancienne)
+            self._entrees[cle] = valeur
+            self._occupe += t
+            while self._occupe > self.capacite:
+                _, evincee = self._entrees.popitem(last=False)
+                self._occupe -= self._taille(evincee)
+
+    def __contains__(self, cle: K) -> bool:
+        return cle in self._entrees
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+
+__all__ = ["StockageContenu", "CacheLRU", "empreinte"]
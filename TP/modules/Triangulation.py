@@ -12,9 +12,23 @@ La représentation binaire de `Triangles` est donc en deux parties:
     triangle dans le `PointSet`.
 """
 
-from typing import Iterable, Tuple, List
 import struct
+from array import array
+from typing import BinaryIO, Iterable, List, Tuple
+
 from Point import Point
+from TP.modules.Analyse import aires
+from TP.modules.PointSet import (
+    _NATIF_LITTLE_ENDIAN,
+    PointSet,
+    _ecrire_tableau,
+    _enregistrer,
+    _fermer_projection,
+    _lire_dans,
+    _lire_tableau,
+    _octets_tableau,
+    _projeter,
+)
 
 Triangle = Tuple[Point, Point, Point]
 
@@ -32,6 +46,11 @@ class Triangulation:
 	Deux modes:
 	 - stockage direct des triangles (liste de triplets de Point)
 	 - résultat décodé via from_binary: attributs vertices (PointSet-like) et triangles (indices)
+
+	Dans le second mode, les indices sont conservés dans un `array('I')` plat
+	(i1, i2, i3, i1, i2, i3, ...) ; les `TriangleIndices` ne sont créés qu'au
+	premier accès à `triangles`. Après `load`, sommets et indices sont des vues
+	en lecture seule sur le fichier projeté en mémoire.
 	"""
 
 	_COUNT_STRUCT = struct.Struct("<I")
@@ -40,11 +59,70 @@ class Triangulation:
 	def __init__(self, triangles: Iterable[Triangle] | None = None):
 		self._liste_triangles: list[Triangle] = []
 		self.vertices = None            # sera un PointSet pour le résultat binaire
-		self.triangles: List[TriangleIndices] | None = None  # triangles par indices
+		self._triangles: List[TriangleIndices] | None = None  # triangles par indices
+		self._indices: array | None = None
+		self._projection = None  # fichier projeté par `load_binary`
 		if triangles:
 			for tri in triangles:
 				self.ajouter_triangle(*tri)
 
+	@classmethod
+	def from_indices(cls, vertices, indices: array) -> "Triangulation":
+		"""Résultat par indices adossé à un `array('I')` plat (non copié)."""
+		if len(indices) % 3:
+			raise ValueError("Nombre d'indices non multiple de 3")
+		obj = cls()
+		obj.vertices = vertices
+		obj._indices = indices
+		return obj
+
+	@property
+	def triangles(self) -> List[TriangleIndices] | None:
+		"""Triangles par indices, créés à partir du tableau si besoin."""
+		if self._triangles is None and self._indices is not None:
+			idx = self._indices
+			self._triangles = [
+				TriangleIndices(idx[i], idx[i + 1], idx[i + 2])
+				for i in range(0, len(idx), 3)
+			]
+			self._indices = None  # la liste (modifiable) devient la référence
+		return self._triangles
+
+	@triangles.setter
+	def triangles(self, value: List[TriangleIndices] | None) -> None:
+		self._triangles = value
+		self._indices = None
+
+	def indices(self) -> array | None:
+		"""Indices plats des triangles dans un `array('I')`."""
+		if self._indices is not None:
+			return self._indices
+		if self._triangles is None:
+			return None
+		out = array("I")
+		for t in self._triangles:
+			out.extend(t.get_indices())
+		return out
+
+	def valider(self) -> None:
+		"""Vérifie que les indices référencent des sommets existants.
+
+		Non fait au décodage (`from_binary`, `load`) : à appeler avant d'utiliser
+		des données d'origine inconnue.
+
+		Raises:
+			ValueError: si un indice est hors des sommets.
+		"""
+		idx = self.indices()
+		if idx and max(idx) >= len(self.vertices):
+			raise ValueError("Indice de sommet hors du PointSet")
+
+	def nombre_triangles(self) -> int:
+		"""Nombre de triangles du résultat par indices (sans les matérialiser)."""
+		if self._indices is not None:
+			return len(self._indices) // 3
+		return len(self._triangles) if self._triangles is not None else 0
+
 	# --- Gestion ---
 	def ajouter_triangle(self, a: Point, b: Point, c: Point) -> None:
 		self._liste_triangles.append((a, b, c))
@@ -83,6 +161,29 @@ class Triangulation:
 			triangles.append((p0, pts[i], pts[i + 1]))
 		return cls(triangles)
 
+	@classmethod
+	def eventail(cls, ensemble_points: PointSet) -> "Triangulation":
+		"""Triangulation éventail par indices, en temps linéaire.
+
+		Même maillage binaire que `depuis_ensemble_eventail`, sans triplets de
+		`Point` (ni recherche de doublons dans `to_binary`).
+		"""
+		n = len(ensemble_points)
+		if n < 3:
+			return cls()
+		indices = array("I", bytes(3 * (n - 2) * cls._COUNT_STRUCT.size))
+		indices[1::3] = array("I", range(1, n - 1))
+		indices[2::3] = array("I", range(2, n))
+		return cls.from_indices(ensemble_points, indices)
+
+	@staticmethod
+	def compter_eventail(nombre_points: int) -> Tuple[int, int]:
+		"""(nombre de sommets, nombre de triangles) de `depuis_ensemble_eventail`
+		sur `nombre_points` points, sans la construire."""
+		if nombre_points < 3:
+			return 0, 0
+		return nombre_points, nombre_points - 2
+
 	# --- Calcul de l'Aire du triangle ---
 	@staticmethod
 	def _aire_triangle(tri: Triangle) -> float:
@@ -93,6 +194,9 @@ class Triangulation:
 		return abs((x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2)) * 0.5)
 
 	def aire_totale(self) -> float:
+		if self.vertices is not None and not self._liste_triangles:
+			# Résultat par indices : calcul direct sur les tableaux
+			return sum(aires(self))
 		return sum(self._aire_triangle(t) for t in self._liste_triangles)
 
 	# --- Sérialisation des données en bynaires pour le stockage facile ---
@@ -138,35 +242,89 @@ class Triangulation:
 		vertices_section = cls._COUNT_STRUCT.size + n_vertices * cls._POINT_STRUCT.size
 		if len(data) < vertices_section + cls._COUNT_STRUCT.size:
 			raise ValueError("Données incomplètes pour les triangles")
-		# Charger les sommets
-		pos = cls._COUNT_STRUCT.size
-		verts: list[Point] = []
-		for _ in range(n_vertices):
-			x, y = cls._POINT_STRUCT.unpack_from(data, pos)
-			verts.append(Point(x, y))
-			pos += cls._POINT_STRUCT.size
 		# Partie 2 : triangles par indices
-		(n_tris,) = cls._COUNT_STRUCT.unpack_from(data, pos)
-		pos += cls._COUNT_STRUCT.size
-		triangles_indices: List[TriangleIndices] = []
+		(n_tris,) = cls._COUNT_STRUCT.unpack_from(data, vertices_section)
+		pos = vertices_section + cls._COUNT_STRUCT.size
 		index_struct = cls._COUNT_STRUCT  # <I
-		expected_total = vertices_section + cls._COUNT_STRUCT.size + n_tris * 3 * index_struct.size
+		expected_total = pos + n_tris * 3 * index_struct.size
 		if len(data) != expected_total:
 			raise ValueError("Longueur binaire incohérente")
-		for _ in range(n_tris):
-			i1, = index_struct.unpack_from(data, pos); pos += index_struct.size
-			i2, = index_struct.unpack_from(data, pos); pos += index_struct.size
-			i3, = index_struct.unpack_from(data, pos); pos += index_struct.size
-			triangles_indices.append(TriangleIndices(i1, i2, i3))
-		obj = cls()
-		from TP.modules.PointSet import PointSet  # import local pour éviter cycle
-		obj.vertices = PointSet(verts)
-		obj.triangles = triangles_indices
-		return obj
+		vue = memoryview(data)
+		verts = PointSet.from_bytes(vue[:vertices_section])
+		indices = array("I")
+		indices.frombytes(vue[pos:])
+		if not _NATIF_LITTLE_ENDIAN:
+			indices.byteswap()
+		return cls.from_indices(verts, indices)
+
+	@classmethod
+	def section_triangles(cls, data: bytes) -> int:
+		"""Position de la partie 2 (triangles) dans le binaire, lue dans l'en-tête."""
+		if len(data) < cls._COUNT_STRUCT.size:
+			raise ValueError("Données trop courtes")
+		(n_vertices,) = cls._COUNT_STRUCT.unpack_from(data, 0)
+		pos = cls._COUNT_STRUCT.size + n_vertices * cls._POINT_STRUCT.size
+		if len(data) < pos + cls._COUNT_STRUCT.size:
+			raise ValueError("Données incomplètes pour les triangles")
+		return pos
+
+	@classmethod
+	def compter_binaire(cls, data: bytes) -> Tuple[int, int]:
+		"""(nombre de sommets, nombre de triangles) lus dans les en-têtes."""
+		pos = cls.section_triangles(data)
+		(n_vertices,) = cls._COUNT_STRUCT.unpack_from(data, 0)
+		(n_tris,) = cls._COUNT_STRUCT.unpack_from(data, pos)
+		return n_vertices, n_tris
+
+	@classmethod
+	def tranche_triangles_binaire(
+		cls, data: bytes, offset: int = 0, count: int | None = None
+	) -> bytes:
+		"""Partie 2 (nombre + indices) réduite aux triangles [offset, offset + count).
+
+		Extraite sans décodage, les indices référencent toujours les sommets complets.
+		"""
+		if offset < 0 or (count is not None and count < 0):
+			raise ValueError("offset et count doivent être positifs")
+		pos = cls.section_triangles(data)
+		(n_tris,) = cls._COUNT_STRUCT.unpack_from(data, pos)
+		debut = min(offset, n_tris)
+		fin = n_tris if count is None else min(n_tris, debut + count)
+		pos += cls._COUNT_STRUCT.size
+		taille = 3 * cls._COUNT_STRUCT.size
+		vue = memoryview(data)[pos + debut * taille:pos + fin * taille]
+		return cls._COUNT_STRUCT.pack(fin - debut) + vue
+
+	@classmethod
+	def from_stream(cls, flux: BinaryIO) -> "Triangulation":
+		"""Décode le format vertices+indices depuis un objet fichier ou un flux HTTP.
+
+		Sommets et indices sont lus directement dans leurs tableaux.
+		"""
+		verts = PointSet._lire_flux(flux)
+		entete = bytearray(cls._COUNT_STRUCT.size)
+		try:
+			_lire_dans(flux, memoryview(entete))
+		except ValueError as e:
+			raise ValueError("Données incomplètes pour les triangles") from e
+		(n_tris,) = cls._COUNT_STRUCT.unpack(entete)
+		try:
+			indices = _lire_tableau(flux, "I", 3 * n_tris)
+		except ValueError as e:
+			raise ValueError("Longueur binaire incohérente") from e
+		if flux.read(1):
+			raise ValueError("Longueur binaire incohérente")
+		return cls.from_indices(verts, indices)
 
 	def to_binary(self) -> bytes:
 		"""Encode format vertices + indices (fan si nécessaire)."""
-		from TP.modules.PointSet import PointSet
+		if self.vertices is not None and self._indices is not None:
+			# Chemin rapide : sommets et indices déjà contigus
+			return b"".join((
+				self.vertices.to_bytes(),
+				self._COUNT_STRUCT.pack(len(self._indices) // 3),
+				_octets_tableau(self._indices),
+			))
 		if self.vertices is not None and self.triangles is not None:
 			verts = self.vertices
 			tris = self.triangles
@@ -197,15 +355,102 @@ class Triangulation:
 			out.extend(self._COUNT_STRUCT.pack(i3))
 		return bytes(out)
 
+	@classmethod
+	def from_buffer(cls, data) -> "Triangulation":
+		"""Format vertices+indices adossé à un tampon (bytes, mmap...), sans copie.
+
+		Seuls les en-têtes et la longueur sont vérifiés (voir `valider`).
+		"""
+		vue = memoryview(data).cast("B")
+		try:
+			pos = cls.section_triangles(vue)
+			(n_tris,) = cls._COUNT_STRUCT.unpack_from(vue, pos)
+			debut = pos + cls._COUNT_STRUCT.size
+			if len(vue) != debut + n_tris * 3 * cls._COUNT_STRUCT.size:
+				raise ValueError("Longueur binaire incohérente")
+		except ValueError:
+			vue.release()  # le tampon (projection de `load_binary`) reste refermable
+			raise
+		if not _NATIF_LITTLE_ENDIAN:
+			return cls.from_binary(vue)
+		verts = PointSet.from_buffer(vue[:pos])
+		return cls.from_indices(verts, vue[debut:].toreadonly().cast("I"))
+
+	def ecrire(self, flux: BinaryIO) -> None:
+		"""Écrit le format vertices+indices dans un flux, sans constituer les octets.
+
+		Raises:
+			ValueError: pour une triangulation de triplets de `Point` (voir `save`).
+		"""
+		idx = self.indices()
+		if self.vertices is None or idx is None:
+			raise ValueError("Triangulation de Point : utiliser save (ancien format)")
+		self.vertices.ecrire(flux)
+		flux.write(self._COUNT_STRUCT.pack(len(idx) // 3))
+		_ecrire_tableau(flux, idx)
+
+	def _ecrire_ancien(self, flux: BinaryIO) -> None:
+		"""Écrit l'ancien format (`to_bytes`) triangle par triangle."""
+		flux.write(self._COUNT_STRUCT.pack(len(self._liste_triangles)))
+		triangle = struct.Struct("<6f")
+		for a, b, c in self._liste_triangles:
+			flux.write(triangle.pack(
+				a.get_x(), a.get_y(), b.get_x(), b.get_y(), c.get_x(), c.get_y()
+			))
+
 	def save(self, file_path: str) -> None:
-		with open(file_path, "wb") as f:
-			f.write(self.to_bytes())
+		"""Enregistre les triplets de `Point` dans l'ancien format (`to_bytes`).
+
+		Raises:
+			ValueError: pour un résultat par indices (voir `save_binary`).
+		"""
+		if self.vertices is not None and not self._liste_triangles:
+			raise ValueError("Triangulation par indices : utiliser save_binary")
+		_enregistrer(file_path, self._ecrire_ancien)
 
 	@classmethod
 	def load(cls, file_path: str) -> "Triangulation":
+		"""Relit un fichier écrit par `save` (ancien format)."""
 		with open(file_path, "rb") as f:
 			return cls.from_bytes(f.read())
 
+	def save_binary(self, file_path: str) -> None:
+		"""Enregistre un résultat par indices au format `to_binary`."""
+		_enregistrer(file_path, self.ecrire)
+
+	@classmethod
+	def load_binary(cls, file_path: str) -> "Triangulation":
+		"""Triangulation adossée au fichier projeté en mémoire (voir `from_buffer`).
+
+		La projection est libérée par `close`, ou en sortie de `with`.
+		"""
+		projection = _projeter(file_path)
+		try:
+			obj = cls.from_buffer(projection)
+		except BaseException:
+			projection.close()
+			raise
+		obj._projection = projection
+		return obj
+
+	def close(self) -> None:
+		"""Libère la projection en mémoire d'une triangulation lue par `load_binary`.
+
+		Sans effet sur une autre triangulation.
+
+		Raises:
+			BufferError: si une vue sur le fichier est encore utilisée.
+		"""
+		if self._projection is not None:
+			_fermer_projection(self._projection, self._indices, self.vertices._coords)
+			self._projection = None
+
+	def __enter__(self) -> "Triangulation":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
 	def __repr__(self) -> str:
 		return f"Triangulation({len(self)} triangles)"
 
@@ -0,0 +1,193 @@
+"""Tuilage
+Représentation multi-résolution d'une triangulation, pour les visualiseurs.
+
+Le carré qui englobe les sommets est découpé en quadtree : au niveau de zoom
+`z` il compte 2^z x 2^z tuiles, repérées par (x, y) à partir du coin
+(minX, minY), x croissant avec X et y avec Y.
+- Au niveau `zoom_max` le maillage est complet.
+- Aux niveaux inférieurs il est simplifié par regroupement de sommets : les
+  sommets d'une même cellule (grille de `resolution` x `resolution` cellules
+  par tuile) sont fusionnés et les triangles devenus dégénérés disparaissent.
+
+Un niveau n'est calculé qu'à sa première demande. Chacun de ses triangles est
+alors rangé dans le plus petit nœud du quadtree qui contient sa boîte
+englobante : une tuile ne parcourt que ses triangles et ceux de ses ancêtres,
+et un grand triangle n'est pas dupliqué dans toutes les tuiles qu'il couvre.
+"""
+
+import threading
+from array import array
+from typing import Dict, Tuple
+
+from TP.modules.PointSet import PointSet
+from TP.modules.Triangulation import Triangulation
+
+Noeud = Tuple[int, int, int]  # (profondeur, x, y)
+
+
+class _Niveau:
+    """Maillage d'un niveau de zoom et son index par nœud du quadtree."""
+
+    def __init__(self, coords: array, indices: array, noeuds: Dict[Noeud, array]):
+        self.coords = coords
+        self.indices = indices
+        self.noeuds = noeuds
+
+
+class PyramideTuiles:
+    """Pyramide de tuiles d'une triangulation, calculée paresseusement."""
+
+    def __init__(
+        self, triangulation: Triangulation, zoom_max: int = 8, resolution: int = 256
+    ):
+        """
+        Args:
+            triangulation: triangulation par indices (vertices + triangles)
+            zoom_max: niveau le plus fin, où le maillage est complet
+            resolution: cellules de regroupement par côté de tuile (niveaux
+                simplifiés)
+        """
+        if zoom_max < 0 or resolution < 1:
+            raise ValueError("zoom_max doit être >= 0 et resolution >= 1")
+        self.zoom_max = zoom_max
+        self.resolution = resolution
+        self._coords = triangulation.vertices.coordinates()
+        self._indices = triangulation.indices() or array("I")
+        bbox = triangulation.vertices.bounding_box() or (0.0, 0.0, 0.0, 0.0)
+        self.origine = (bbox[0], bbox[1])
+        self.cote = max(bbox[2] - bbox[0], bbox[3] - bbox[1]) or 1.0
+        self._niveaux: Dict[int, _Niveau] = {}
+        self._verrou = threading.Lock()
+
+    def rectangle(self, z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+        """Emprise (minX, minY, maxX, maxY) de la tuile (z, x, y)."""
+        pas = self.cote / (1 << z)
+        ox, oy = self.origine
+        return ox + x * pas, oy + y * pas, ox + (x + 1) * pas, oy + (y + 1) * pas
+
+    def _case(self, v: float, o: float, n: int) -> int:
+        """Indice de la case (sur n) contenant la coordonnée v."""
+        return min(max(int((v - o) * n / self.cote), 0), n - 1)
+
+    def niveau(self, z: int) -> _Niveau:
+        """Maillage et index du niveau z, calculés à la première demande."""
+        niv = self._niveaux.get(z)
+        if niv is None:
+            with self._verrou:
+                niv = self._niveaux.get(z)
+                if niv is None:
+                    if z == self.zoom_max:
+                        coords, indices = self._coords, self._indices
+                    else:
+                        coords, indices = self._simplifier((1 << z) * self.resolution)
+                    niv = _Niveau(coords, indices, self._indexer(coords, indices, z))
+                    self._niveaux[z] = niv
+        return niv
+
+    def _simplifier(self, n: int) -> Tuple[array, array]:
+        """Regroupe les sommets sur une grille n x n, retire les triangles dégénérés."""
+        ox, oy = self.origine
+        c = self._coords
+        representants: Dict[int, int] = {}
+        nouveau = array("I", [0]) * (len(c) // 2)
+        coords = array("f")
+        for i in range(len(c) // 2):
+            x, y = c[2 * i], c[2 * i + 1]
+            cle = self._case(y, oy, n) * n + self._case(x, ox, n)
+            j = representants.get(cle)
+            if j is None:
+                j = representants[cle] = len(representants)
+                coords.append(x)
+                coords.append(y)
+            nouveau[i] = j
+        idx = self._indices
+        indices = array("I")
+        vus = set()
+        for t in range(0, len(idx), 3):
+            a, b, d = nouveau[idx[t]], nouveau[idx[t + 1]], nouveau[idx[t + 2]]
+            if a == b or d in (a, b):
+                continue
+            cle = frozenset((a, b, d))
+            if cle in vus:
+                continue
+            vus.add(cle)
+            indices.extend((a, b, d))
+        return coords, indices
+
+    def _boite(
+        self, coords: array, indices: array, t: int
+    ) -> Tuple[float, float, float, float]:
+        """Boîte englobante du triangle numéro t."""
+        a, b, d = indices[3 * t], indices[3 * t + 1], indices[3 * t + 2]
+        xs = (coords[2 * a], coords[2 * b], coords[2 * d])
+        ys = (coords[2 * a + 1], coords[2 * b + 1], coords[2 * d + 1])
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _indexer(self, coords: array, indices: array, z: int) -> Dict[Noeud, array]:
+        """Range chaque triangle dans le plus petit nœud (profondeur <= z) englobant."""
+        ox, oy = self.origine
+        n = 1 << z
+        noeuds: Dict[Noeud, array] = {}
+        for t in range(len(indices) // 3):
+            x0, y0, x1, y1 = self._boite(coords, indices, t)
+            cx0, cx1 = self._case(x0, ox, n), self._case(x1, ox, n)
+            cy0, cy1 = self._case(y0, oy, n), self._case(y1, oy, n)
+            # Niveaux à remonter pour que les deux coins tombent dans le même nœud
+            k = max((cx0 ^ cx1).bit_length(), (cy0 ^ cy1).bit_length())
+            cle = (z - k, cx0 >> k, cy0 >> k)
+            ids = noeuds.get(cle)
+            if ids is None:
+                ids = noeuds[cle] = array("I")
+            ids.append(t)
+        return noeuds
+
+    def tuile(self, z: int, x: int, y: int) -> Triangulation:
+        """Triangles du niveau z dont la boîte englobante touche la tuile (x, y).
+
+        Le résultat ne contient que les sommets utilisés, réindexés.
+
+        Raises:
+            ValueError: si la tuile est hors de la pyramide.
+        """
+        n = 1 << z if z >= 0 else 0
+        if not 0 <= z <= self.zoom_max or not (0 <= x < n and 0 <= y < n):
+            raise ValueError("Tuile hors de la pyramide")
+        niv = self.niveau(z)
+        rx0, ry0, rx1, ry1 = self.rectangle(z, x, y)
+        choisis = array("I")
+        for profondeur in range(z + 1):
+            k = z - profondeur
+            ids = niv.noeuds.get((profondeur, x >> k, y >> k))
+            if not ids:
+                continue
+            if not k:
+                choisis.extend(ids)  # contenus dans la tuile
+                continue
+            for t in ids:
+                x0, y0, x1, y1 = self._boite(niv.coords, niv.indices, t)
+                if x1 >= rx0 and x0 <= rx1 and y1 >= ry0 and y0 <= ry1:
+                    choisis.append(t)
+        renumerotes: Dict[int, int] = {}
+        coords = array("f")
+        indices = array("I")
+        for t in choisis:
+            for v in niv.indices[3 * t : 3 * t + 3]:
+                j = renumerotes.get(v)
+                if j is None:
+                    j = renumerotes[v] = len(renumerotes)
+                    coords.append(niv.coords[2 * v])
+                    coords.append(niv.coords[2 * v + 1])
+                indices.append(j)
+        return Triangulation.from_indices(PointSet.from_array(coords), indices)
+
+    def description(self) -> dict:
+        """Paramètres du quadtree, pour le visualiseur."""
+        return {
+            "origin": list(self.origine),
+            "size": self.cote,
+            "maxZoom": self.zoom_max,
+            "resolution": self.resolution,
+        }
+
+
+__all__ = ["PyramideTuiles"]
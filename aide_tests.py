@@ -0,0 +1,10 @@
+"""Aides partagées par les tests."""
+
+import struct
+
+
+def pointset_bin(coords):
+    """PointSet binaire (nombre de points, puis X et Y en float) de `coords`."""
+    return struct.pack("<I", len(coords)) + b"".join(
+        struct.pack("<ff", x, y) for x, y in coords
+    )
@@ -3,113 +3,11 @@ Client simple pour tester les APIs PointSetManager et Triangulator.
 """
 
 import requests
-import json
 from Point import Point
+from TP.modules.Client import APIClient
 from TP.modules.PointSet import PointSet
-from TP.modules.Triangulation import Triangulation
 
 
-class APIClient:
-    """Client pour les APIs PointSetManager et Triangulator."""
-    
-    def __init__(self, manager_url="http://127.0.0.1:5000", triangulator_url="http://127.0.0.1:5001"):
-        """
-        Initialise le client.
-        
-        Args:
-            manager_url: URL du PointSetManager
-            triangulator_url: URL du Triangulator
-        """
-        self.manager_url = manager_url.rstrip('/')
-        self.triangulator_url = triangulator_url.rstrip('/')
-    
-    def register_point_set(self, point_set: PointSet) -> str:
-        """
-        Enregistre un PointSet et retourne son ID.
-        
-        Args:
-            point_set: PointSet à enregistrer
-            
-        Returns:
-            ID du PointSet enregistré
-            
-        Raises:
-            Exception: En cas d'erreur
-        """
-        binary_data = point_set.to_bytes()
-        
-        response = requests.post(
-            f"{self.manager_url}/pointset",
-            data=binary_data,
-            headers={"Content-Type": "application/octet-stream"}
-        )
-        
-        if response.status_code == 201:
-            result = response.json()
-            return result["pointSetId"]
-        else:
-            error_msg = f"HTTP {response.status_code}"
-            try:
-                error_data = response.json()
-                error_msg += f": {error_data.get('message', 'Unknown error')}"
-            except:
-                error_msg += f": {response.text}"
-            raise Exception(f"Failed to register PointSet: {error_msg}")
-    
-    def get_point_set(self, point_set_id: str) -> PointSet:
-        """
-        Récupère un PointSet par son ID.
-        
-        Args:
-            point_set_id: ID du PointSet
-            
-        Returns:
-            PointSet récupéré
-            
-        Raises:
-            Exception: En cas d'erreur
-        """
-        response = requests.get(f"{self.manager_url}/pointset/{point_set_id}")
-        
-        if response.status_code == 200:
-            binary_data = response.content
-            return PointSet.from_binary(binary_data)
-        else:
-            error_msg = f"HTTP {response.status_code}"
-            try:
-                error_data = response.json()
-                error_msg += f": {error_data.get('message', 'Unknown error')}"
-            except:
-                error_msg += f": {response.text}"
-            raise Exception(f"Failed to get PointSet: {error_msg}")
-    
-    def get_triangulation(self, point_set_id: str) -> Triangulation:
-        """
-        Calcule la triangulation d'un PointSet.
-        
-        Args:
-            point_set_id: ID du PointSet
-            
-        Returns:
-            Structure Triangles avec la triangulation
-            
-        Raises:
-            Exception: En cas d'erreur
-        """
-        response = requests.get(f"{self.triangulator_url}/triangulation/{point_set_id}")
-        
-        if response.status_code == 200:
-            binary_data = response.content
-            return Triangulation.from_binary(binary_data)
-        else:
-            error_msg = f"HTTP {response.status_code}"
-            try:
-                error_data = response.json()
-                error_msg += f": {error_data.get('message', 'Unknown error')}"
-            except:
-                error_msg += f": {response.text}"
-            raise Exception(f"Failed to get triangulation: {error_msg}")
-
 def test_workflow():
     """Test du workflow complet."""
     print("=== Test du workflow complet ===")
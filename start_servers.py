@@ -4,33 +4,133 @@ Usage (cmd.exe):
   python start_servers.py manager
   python start_servers.py triangulator
   python start_servers.py both
+  python start_servers.py startup   (rapport d'imports et benchmark de démarrage)
 """
 
 import sys
-import uuid
 import threading
-from typing import Dict
-from flask import Flask, request, jsonify, make_response
-import requests
+import time
+import uuid
+from array import array
+from typing import TYPE_CHECKING
 
+from flask import Flask, jsonify, make_response, request
+
+from TP.modules import Analyse
+from TP.modules.Admission import CoutExcessif, Surcharge, Voies, cout_triangulation
+from TP.modules.Contraintes import Contraintes
+from TP.modules.Demarrage import ModuleDiffere, mesurer_demarrage, rapport_imports
 from TP.modules.PointSet import PointSet
+from TP.modules.Stockage import CacheLRU, StockageContenu
 from TP.modules.Triangulation import Triangulation
 
+if TYPE_CHECKING:
+    from TP.modules.Tuilage import PyramideTuiles
+
+# Modules importés à leur première utilisation (ou au préchauffage) : ni le
+# PointSetManager ni le démarrage du Triangulator ne paient leur import
+requests = ModuleDiffere("requests")
+Delaunay = ModuleDiffere("TP.modules.Delaunay")
+Tuilage = ModuleDiffere("TP.modules.Tuilage")
+# (Analyse, léger, est déjà importé par Triangulation)
+_DEFERRED = (requests, Delaunay, Tuilage)
+# Budget de démarrage d'un worker Triangulator (import + préchauffage, secondes)
+STARTUP_BUDGET = 1.0
+
+# En-tête portant l'empreinte SHA-256 du contenu d'un PointSet
+HASH_HEADER = "X-Content-SHA256"
+# Un PointSet enregistré ne change plus : ses représentations non plus
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _cacheable(resp, etag: str):
+    """Ajoute l'ETag (fort) et l'en-tête Cache-Control immuable à une réponse."""
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = CACHE_CONTROL
+    return resp
+
+
+def _not_modified(etag: str):
+    """Réponse 304 si la requête porte un If-None-Match correspondant, None sinon."""
+    if request.if_none_match.contains_weak(etag):
+        return _cacheable(make_response("", 304), etag)
+    return None
+
+
+def _slice_args() -> tuple[int, int | None] | None:
+    """Paramètres `offset`/`count` de la requête, None s'ils sont absents.
+
+    Raises:
+        ValueError: si l'un d'eux n'est pas un entier.
+    """
+    if "offset" not in request.args and "count" not in request.args:
+        return None
+    try:
+        offset = int(request.args.get("offset", 0))
+        count = request.args.get("count")
+        return offset, None if count is None else int(count)
+    except ValueError as e:
+        raise ValueError("offset et count doivent être des entiers") from e
+
+
+def _partial_response(binary: bytes, etag: str | None):
+    """Réponse binaire cacheable, qui honore aussi l'en-tête HTTP Range."""
+    resp = make_response(binary)
+    resp.headers["Content-Type"] = "application/octet-stream"
+    if etag is not None:
+        _cacheable(resp, etag)
+    return resp.make_conditional(
+        request, accept_ranges=True, complete_length=len(binary)
+    )
+
+
 # --- PointSetManager ---
 manager_app = Flask("pointset_manager")
-_STORAGE: Dict[str, bytes] = {}
+# Stockage adressé par contenu : un blob par contenu distinct, plusieurs UUID possibles
+_STORAGE = StockageContenu()
+# Admission : limites vérifiées sur l'en-tête, avant de lire les coordonnées
+MAX_BODY_BYTES = 256 * 1024 * 1024
+MAX_POINTS = 10_000_000
+
+
+def _too_large(code: str, message: str):
+    return jsonify({"code": code, "message": message}), 413
+
 
 @manager_app.post("/pointset")
 def register_pointset():
-    data = request.get_data()
+    length = request.content_length
+    if length is not None and length > MAX_BODY_BYTES:
+        return _too_large("TOO_LARGE", f"Corps limité à {MAX_BODY_BYTES} octets")
     try:
-        # validation du format
-        _ = PointSet.from_binary(data)
+        count = PointSet.lire_entete(request.stream)
+        if count > MAX_POINTS:
+            return _too_large(
+                "TOO_MANY_POINTS", f"PointSet limité à {MAX_POINTS} points"
+            )
+        size = PointSet.taille_binaire(count)
+        if size > MAX_BODY_BYTES:
+            return _too_large("TOO_LARGE", f"Corps limité à {MAX_BODY_BYTES} octets")
+        if length is not None and length != size:
+            raise ValueError("Longueur incohérente avec le nombre de points")
+        # validation du format : coordonnées lues directement dans le tableau
+        ps = PointSet.from_stream(request.stream, count)
     except Exception as e:
         return jsonify({"code": "BAD_FORMAT", "message": str(e)}), 400
+    data = ps.to_bytes()
     ps_id = str(uuid.uuid4())
-    _STORAGE[ps_id] = data
-    return jsonify({"pointSetId": ps_id}), 201
+    # Métadonnées calculées une fois ici, servies ensuite en temps constant
+    emprise = ps.bbox_and_centroid()
+    header = {
+        "pointCount": len(ps),
+        "boundingBox": list(emprise[0]) if emprise else None,
+        "centroid": list(emprise[1]) if emprise else None,
+    }
+    content_hash = _STORAGE.ajouter(ps_id, data, header)
+    resp = jsonify({"pointSetId": ps_id, "contentHash": content_hash})
+    resp.headers[HASH_HEADER] = content_hash
+    return resp, 201
+
 
 @manager_app.get("/pointset/<point_set_id>")
 def get_pointset(point_set_id: str):
@@ -39,16 +139,277 @@ def get_pointset(point_set_id: str):
         uuid.UUID(point_set_id)
     except ValueError:
         return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
-    raw = _STORAGE.get(point_set_id)
-    if raw is None:
+    entree = _STORAGE.get_avec_empreinte(point_set_id)
+    if entree is None:
         return jsonify({"code": "NOT_FOUND", "message": "PointSet introuvable"}), 404
-    resp = make_response(raw)
-    resp.headers["Content-Type"] = "application/octet-stream"
+    content_hash, raw = entree
+    not_modified = _not_modified(content_hash)
+    if not_modified is not None:
+        return not_modified
+    try:
+        window = _slice_args()
+        if window is not None:
+            # Tranche extraite directement du blob stocké, sans décodage
+            raw = PointSet.tranche_binaire(raw, *window)
+    except ValueError as e:
+        return jsonify({"code": "BAD_RANGE", "message": str(e)}), 400
+    resp = _partial_response(raw, content_hash)
+    resp.headers[HASH_HEADER] = content_hash
     return resp
 
+
+@manager_app.get("/pointset/<point_set_id>/header")
+def get_pointset_header(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    header = _STORAGE.metadonnees(point_set_id)
+    if header is None:
+        return jsonify({"code": "NOT_FOUND", "message": "PointSet introuvable"}), 404
+    return jsonify(
+        {
+            "pointSetId": point_set_id,
+            "contentHash": _STORAGE.empreinte(point_set_id),
+            **header,
+        }
+    )
+
+
+def _hull(data: bytes) -> list[int]:
+    """Indices de l'enveloppe convexe d'un PointSet binaire."""
+    return PointSet.from_binary(data).convex_hull().tolist()
+
+
+@manager_app.get("/pointset/<point_set_id>/hull")
+def get_pointset_hull(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    try:
+        # Calculée une fois par contenu, puis conservée avec lui
+        hull = _STORAGE.derive(point_set_id, "convexHull", _hull)
+    except KeyError:
+        return jsonify({"code": "NOT_FOUND", "message": "PointSet introuvable"}), 404
+    return jsonify(
+        {
+            "pointSetId": point_set_id,
+            "contentHash": _STORAGE.empreinte(point_set_id),
+            "convexHull": hull,
+        }
+    )
+
+
+@manager_app.delete("/pointset/<point_set_id>")
+def delete_pointset(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    if not _STORAGE.retirer(point_set_id):
+        return jsonify({"code": "NOT_FOUND", "message": "PointSet introuvable"}), 404
+    return "", 204
+
+
 # --- Triangulator ---
 triangulator_app = Flask("triangulator")
 MANAGER_URL = "http://127.0.0.1:5000"
+# Résultats binaires par empreinte de contenu (octets) et empreinte par UUID
+_RESULTS = CacheLRU(256 * 1024 * 1024)
+_HASHES = CacheLRU(100_000, taille=lambda _: 1)
+# Statistiques de maillage par empreinte
+_STATS = CacheLRU(100_000, taille=lambda _: 1)
+# Tuilage : pyramides (niveaux calculés à la demande) et tuiles binaires
+TILE_MAX_ZOOM = 8
+TILE_RESOLUTION = 256
+_PYRAMIDS = CacheLRU(8, taille=lambda _: 1)
+_TILES = CacheLRU(64 * 1024 * 1024)
+# Admission des calculs : coût estimé sur le nombre de points (voir Admission),
+# petite voie pour les calculs courts, grande voie pour les autres
+MAX_CONSTRAINTS_BYTES = 16 * 1024 * 1024
+SMALL_LANE_MAX_COST = 50_000
+MAX_TRIANGULATION_COST = 50_000_000
+_LANES = Voies(
+    SMALL_LANE_MAX_COST,
+    MAX_TRIANGULATION_COST,
+    places_petite=4,
+    places_grande=1,
+    attente=5.0,
+)
+
+
+def _triangulation_etag(content_hash: str) -> str:
+    """ETag d'une triangulation, distinct de celui du PointSet source."""
+    return f"{content_hash}.triangulation"
+
+
+def _fetch_pointset(point_set_id: str, content_hash: str | None = None):
+    """Demande un PointSet au manager, en flux.
+
+    Avec `content_hash`, la requête est conditionnelle : le manager répond 304,
+    sans corps, si l'UUID désigne toujours ce contenu.
+
+    Returns:
+        (réponse du manager, None), ou (None, réponse d'erreur).
+    """
+    headers = (
+        {"If-None-Match": f'"{content_hash}"'} if content_hash is not None else None
+    )
+    try:
+        r = requests.get(
+            f"{MANAGER_URL}/pointset/{point_set_id}", stream=True, headers=headers
+        )
+    except requests.exceptions.RequestException as e:
+        return None, (jsonify({"code": "MANAGER_UNAVAILABLE", "message": str(e)}), 503)
+    if r.status_code in (200, 304):
+        return r, None
+    with r:
+        if r.status_code == 404:
+            return None, (
+                jsonify({"code": "NOT_FOUND", "message": "PointSet introuvable"}),
+                404,
+            )
+        return None, (
+            jsonify(
+                {"code": "UPSTREAM_ERROR", "message": f"Manager status {r.status_code}"}
+            ),
+            503,
+        )
+
+
+def _load_triangulation(
+    point_set_id: str, conditional: bool = True, constraints: Contraintes | None = None
+):
+    """Triangulation binaire d'un PointSet, depuis le cache ou calculée.
+
+    Sans `constraints`, triangulation éventail ; avec, triangulation de
+    Delaunay contrainte, mise en cache par contenu et par contraintes.
+
+    Returns:
+        (result_key, binary, None), ou (None, None, réponse) lorsque la
+        requête se termine plus tôt (erreur, ou 304 si `conditional`).
+        `result_key` est l'empreinte du contenu, suivie de celle des
+        contraintes s'il y en a.
+    """
+    suffix = "" if constraints is None else f".{constraints.empreinte()}"
+    # Empreinte déjà connue : un GET conditionnel (304 sans corps) confirme que
+    # l'UUID existe toujours avant de servir le résultat en cache
+    r = None
+    known_hash = _HASHES.get(point_set_id)
+    if known_hash is not None:
+        r, early = _fetch_pointset(point_set_id, known_hash)
+        if early is not None:
+            return None, None, early
+        if r.status_code == 304:
+            with r:
+                pass
+            r = None
+            if conditional:
+                not_modified = _not_modified(_triangulation_etag(known_hash))
+                if not_modified is not None:
+                    return None, None, not_modified
+            binary = _RESULTS.get(known_hash + suffix)
+            if binary is not None:
+                return known_hash + suffix, binary, None
+    if r is None:
+        # Premier accès, ou résultat évincé : le corps est nécessaire
+        r, early = _fetch_pointset(point_set_id)
+        if early is not None:
+            return None, None, early
+    with r:
+        content_hash = r.headers.get(HASH_HEADER)
+        if content_hash is not None:
+            _HASHES.put(point_set_id, content_hash)
+            # Contenu connu du client ou déjà triangulé : le corps n'est pas lu
+            if conditional:
+                not_modified = _not_modified(_triangulation_etag(content_hash))
+                if not_modified is not None:
+                    return None, None, not_modified
+            binary = _RESULTS.get(content_hash + suffix)
+            if binary is not None:
+                return content_hash + suffix, binary, None
+        try:
+            r.raw.decode_content = True
+            count = PointSet.lire_entete(r.raw)
+        except requests.exceptions.RequestException as e:
+            return (
+                None,
+                None,
+                (jsonify({"code": "MANAGER_UNAVAILABLE", "message": str(e)}), 503),
+            )
+        except Exception as e:
+            return (
+                None,
+                None,
+                (jsonify({"code": "BAD_UPSTREAM_DATA", "message": str(e)}), 500),
+            )
+        # Admission avant de lire les coordonnées
+        try:
+            place = _LANES.admettre(cout_triangulation(count, constraints is not None))
+        except CoutExcessif as e:
+            return None, None, _too_large("TOO_EXPENSIVE", str(e))
+        except Surcharge as e:
+            resp = make_response(
+                jsonify({"code": "OVERLOADED", "message": str(e)}), 503
+            )
+            resp.headers["Retry-After"] = str(int(e.retry_after))
+            return None, None, resp
+        with place:
+            return _compute_triangulation(
+                r.raw, count, content_hash, suffix, constraints
+            )
+
+
+def _compute_triangulation(
+    raw,
+    count: int,
+    content_hash: str | None,
+    suffix: str,
+    constraints: Contraintes | None,
+):
+    """Lit les coordonnées, calcule la triangulation et la met en cache.
+
+    Voir `_load_triangulation`.
+    """
+    try:
+        ps = PointSet.from_stream(raw, count)
+    except requests.exceptions.RequestException as e:
+        return (
+            None,
+            None,
+            (jsonify({"code": "MANAGER_UNAVAILABLE", "message": str(e)}), 503),
+        )
+    except Exception as e:
+        return (
+            None,
+            None,
+            (jsonify({"code": "BAD_UPSTREAM_DATA", "message": str(e)}), 500),
+        )
+    if constraints is None:
+        # Éventail par indices : linéaire, comme son coût estimé
+        tri = Triangulation.eventail(ps)
+    else:
+        try:
+            tri = Delaunay.trianguler(ps, constraints)
+        except ValueError as e:
+            return (
+                None,
+                None,
+                (jsonify({"code": "BAD_CONSTRAINTS", "message": str(e)}), 400),
+            )
+        except RuntimeError as e:
+            return (
+                None,
+                None,
+                (jsonify({"code": "TRIANGULATION_FAILED", "message": str(e)}), 500),
+            )
+    binary = tri.to_binary()
+    if content_hash is None:
+        return None, binary, None
+    _RESULTS.put(content_hash + suffix, binary)
+    return content_hash + suffix, binary, None
+
 
 @triangulator_app.get("/triangulation/<point_set_id>")
 def get_triangulation(point_set_id: str):
@@ -56,52 +417,256 @@ def get_triangulation(point_set_id: str):
         uuid.UUID(point_set_id)
     except ValueError:
         return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
-    # Récupérer point set du manager
+    part = request.args.get("part")
     try:
-        r = requests.get(f"{MANAGER_URL}/pointset/{point_set_id}")
-    except requests.exceptions.RequestException as e:
-        return jsonify({"code": "MANAGER_UNAVAILABLE", "message": str(e)}), 503
-    if r.status_code == 404:
-        return jsonify({"code": "NOT_FOUND", "message": "PointSet introuvable"}), 404
-    if r.status_code != 200:
-        return jsonify({"code": "UPSTREAM_ERROR", "message": f"Manager status {r.status_code}"}), 503
+        window = _slice_args()
+    except ValueError as e:
+        return jsonify({"code": "BAD_RANGE", "message": str(e)}), 400
+    if part not in (None, "vertices", "triangles"):
+        return jsonify(
+            {"code": "BAD_RANGE", "message": "part doit valoir vertices ou triangles"}
+        ), 400
+    if window is not None and part is None:
+        return jsonify(
+            {
+                "code": "BAD_RANGE",
+                "message": "offset/count exigent part=vertices|triangles",
+            }
+        ), 400
+    content_hash, binary, early = _load_triangulation(point_set_id)
+    if early is not None:
+        return early
+    # Sections extraites directement du binaire en cache, sans décodage
+    offset, count = window or (0, None)
     try:
-        ps = PointSet.from_binary(r.content)
-    except Exception as e:
-        return jsonify({"code": "BAD_UPSTREAM_DATA", "message": str(e)}), 500
-    # Construire triangulation (éventail naïf)
-    tri = Triangulation.depuis_ensemble_eventail(ps)
-    binary = tri.to_binary()
+        if part == "vertices":
+            vertices = memoryview(binary)[: Triangulation.section_triangles(binary)]
+            binary = PointSet.tranche_binaire(vertices, offset, count)
+        elif part == "triangles":
+            binary = Triangulation.tranche_triangles_binaire(binary, offset, count)
+    except ValueError as e:
+        return jsonify({"code": "BAD_RANGE", "message": str(e)}), 400
+    etag = _triangulation_etag(content_hash) if content_hash is not None else None
+    return _partial_response(binary, etag)
+
+
+@triangulator_app.post("/triangulation/<point_set_id>")
+def post_triangulation(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    if (request.content_length or 0) > MAX_CONSTRAINTS_BYTES:
+        return _too_large(
+            "TOO_LARGE", f"Contraintes limitées à {MAX_CONSTRAINTS_BYTES} octets"
+        )
+    data = request.get_data()
+    if len(data) > MAX_CONSTRAINTS_BYTES:
+        return _too_large(
+            "TOO_LARGE", f"Contraintes limitées à {MAX_CONSTRAINTS_BYTES} octets"
+        )
+    try:
+        constraints = Contraintes.from_binary(data) if data else Contraintes()
+    except ValueError as e:
+        return jsonify({"code": "BAD_FORMAT", "message": str(e)}), 400
+    _, binary, early = _load_triangulation(
+        point_set_id, conditional=False, constraints=constraints
+    )
+    if early is not None:
+        return early
     resp = make_response(binary)
     resp.headers["Content-Type"] = "application/octet-stream"
     return resp
 
 
+@triangulator_app.get("/triangulation/<point_set_id>/header")
+def get_triangulation_header(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    # En-tête du manager (temps constant) : ni triangulation ni décodage
+    try:
+        r = requests.get(f"{MANAGER_URL}/pointset/{point_set_id}/header")
+    except requests.exceptions.RequestException as e:
+        return jsonify({"code": "MANAGER_UNAVAILABLE", "message": str(e)}), 503
+    with r:
+        if r.status_code == 404:
+            return jsonify(
+                {"code": "NOT_FOUND", "message": "PointSet introuvable"}
+            ), 404
+        if r.status_code != 200:
+            return jsonify(
+                {"code": "UPSTREAM_ERROR", "message": f"Manager status {r.status_code}"}
+            ), 503
+        header = r.json()
+    n_vertices, n_tris = Triangulation.compter_eventail(header["pointCount"])
+    return jsonify(
+        {
+            "pointSetId": point_set_id,
+            "vertexCount": n_vertices,
+            "triangleCount": n_tris,
+            # Boîte du maillage renvoyé : aucune sous trois points (maillage vide)
+            "boundingBox": header["boundingBox"] if n_vertices else None,
+        }
+    )
+
+
+@triangulator_app.get("/triangulation/<point_set_id>/stats")
+def get_triangulation_stats(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    content_hash, binary, early = _load_triangulation(point_set_id, conditional=False)
+    if early is not None:
+        return early
+    stats = _STATS.get(content_hash) if content_hash is not None else None
+    if stats is None:
+        stats = Analyse.resume(Triangulation.from_binary(binary))
+        if content_hash is not None:
+            _STATS.put(content_hash, stats)
+    return jsonify({"pointSetId": point_set_id, **stats})
+
+
+def _pyramid(content_hash: str | None, binary: bytes) -> "PyramideTuiles":
+    """Pyramide de tuiles d'une triangulation, réutilisée par empreinte."""
+    pyramid = _PYRAMIDS.get(content_hash) if content_hash is not None else None
+    if pyramid is None:
+        pyramid = Tuilage.PyramideTuiles(
+            Triangulation.from_binary(binary), TILE_MAX_ZOOM, TILE_RESOLUTION
+        )
+        if content_hash is not None:
+            _PYRAMIDS.put(content_hash, pyramid)
+    return pyramid
+
+
+@triangulator_app.get("/triangulation/<point_set_id>/tiles")
+def get_tiling(point_set_id: str):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    content_hash, binary, early = _load_triangulation(point_set_id, conditional=False)
+    if early is not None:
+        return early
+    return jsonify(
+        {"pointSetId": point_set_id, **_pyramid(content_hash, binary).description()}
+    )
+
+
+@triangulator_app.get("/triangulation/<point_set_id>/tiles/<int:z>/<int:x>/<int:y>")
+def get_tile(point_set_id: str, z: int, x: int, y: int):
+    try:
+        uuid.UUID(point_set_id)
+    except ValueError:
+        return jsonify({"code": "BAD_ID", "message": "Format UUID invalide"}), 400
+    content_hash, binary, early = _load_triangulation(point_set_id, conditional=False)
+    if early is not None:
+        return early
+    etag = f"{content_hash}.tile.{z}.{x}.{y}" if content_hash is not None else None
+    if etag is not None:
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+    key = (content_hash, z, x, y)
+    tile = _TILES.get(key) if content_hash is not None else None
+    if tile is None:
+        try:
+            tile = _pyramid(content_hash, binary).tuile(z, x, y).to_binary()
+        except ValueError as e:
+            return jsonify({"code": "BAD_TILE", "message": str(e)}), 400
+        if content_hash is not None:
+            _TILES.put(key, tile)
+    return _partial_response(tile, etag)
+
+
+# --- Démarrage ---
+# Préchauffage du Triangulator : /ready ne répond 200 qu'une fois terminé
+_READY = threading.Event()
+# Durée d'import : mesurée à froid par le mode `startup` (`mesurer_demarrage`)
+_STARTUP = {"warmUpSeconds": None}
+
+
+def warm_up() -> None:
+    """Importe les modules différés et exerce une fois chaque chemin de calcul.
+
+    Les caches de résultats ne sont pas touchés.
+    """
+    t0 = time.perf_counter()
+    for module in _DEFERRED:
+        module.charger()
+    ps = PointSet.from_array(
+        array("f", [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.5, 0.25])
+    )
+    tri = Triangulation.from_binary(
+        Delaunay.trianguler(ps, Contraintes(bord=[0, 1, 2, 3])).to_binary()
+    )
+    Tuilage.PyramideTuiles(tri, 1, 4).tuile(1, 0, 0)
+    Analyse.resume(tri)
+    _STARTUP["warmUpSeconds"] = time.perf_counter() - t0
+    _READY.set()
+
+
+@triangulator_app.get("/ready")
+def get_ready():
+    if not _READY.is_set():
+        return jsonify({"code": "NOT_READY", "message": "Préchauffage en cours"}), 503
+    return jsonify({"status": "ready", **_STARTUP, "lanes": _LANES.occupation()})
+
+
+def startup_report() -> bool:
+    """Affiche le rapport d'imports et le benchmark de démarrage à froid.
+
+    Returns:
+        True si le démarrage tient dans `STARTUP_BUDGET`.
+    """
+    print("Imports les plus coûteux (ms, propre / cumulé) :")
+    for nom, propre, cumule in rapport_imports("start_servers"):
+        print(f"  {propre / 1000:8.1f} {cumule / 1000:8.1f}  {nom}")
+    mesure = mesurer_demarrage("start_servers", "warm_up")
+    print(
+        f"Démarrage (médiane) : import {mesure['import'] * 1000:.1f} ms, "
+        f"préchauffage {mesure['warmUp'] * 1000:.1f} ms, "
+        f"total {mesure['total'] * 1000:.1f} ms "
+        f"(budget {STARTUP_BUDGET * 1000:.0f} ms)"
+    )
+    return mesure["total"] <= STARTUP_BUDGET
+
+
 def run_manager():
     manager_app.run(host="127.0.0.1", port=5000)
 
+
 def run_triangulator():
+    # Le worker écoute tout de suite ; /ready passe à 200 après le préchauffage
+    threading.Thread(target=warm_up, daemon=True).start()
     triangulator_app.run(host="127.0.0.1", port=5001)
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Argument requis: manager | triangulator | both")
+        print("Argument requis: manager | triangulator | both | startup")
         sys.exit(1)
     mode = sys.argv[1].lower()
     if mode == "manager":
         run_manager()
     elif mode == "triangulator":
         run_triangulator()
+    elif mode == "startup":
+        sys.exit(0 if startup_report() else 1)
     elif mode == "both":
         t1 = threading.Thread(target=run_manager, daemon=True)
         t2 = threading.Thread(target=run_triangulator, daemon=True)
-        t1.start(); t2.start()
+        t1.start()
+        t2.start()
         print("Services démarrés. CTRL+C pour arrêter.")
-        t1.join(); t2.join()
+        t1.join()
+        t2.join()
     else:
         print("Mode inconnu.")
         sys.exit(1)
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from TP.modules.Admission import CoutExcessif, Surcharge, Voies, cout_triangulation
+
+
+# [1.7] Admission : coût et voies de calcul
+def test_cout_triangulation():
+    assert cout_triangulation(1000, delaunay=False) == 1000
+    assert cout_triangulation(1024, delaunay=True) == 1024 * 10
+    assert cout_triangulation(0, delaunay=True) == 0
+
+
+def test_voies_repartition_et_refus():
+    voies = Voies(seuil_petite=100, cout_max=1000)
+    assert voies.voie(100) == Voies.PETITE
+    assert voies.voie(101) == Voies.GRANDE
+    with pytest.raises(CoutExcessif):
+        voies.admettre(1001)
+    with pytest.raises(ValueError):
+        Voies(seuil_petite=10, cout_max=1)
+
+
+def test_petite_voie_independante_de_la_grande():
+    voies = Voies(
+        seuil_petite=100, cout_max=1000, places_petite=1, places_grande=1, attente=0.01
+    )
+    with voies.admettre(500) as grande:
+        assert grande.voie == Voies.GRANDE
+        with pytest.raises(Surcharge) as e:
+            voies.admettre(500)
+        assert e.value.retry_after == 0.01
+        # Une petite demande passe malgré la grande voie occupée
+        with voies.admettre(10):
+            assert voies.occupation() == {
+                "small": {"busy": 1, "slots": 1},
+                "large": {"busy": 1, "slots": 1},
+            }
+    assert voies.occupation()["large"]["busy"] == 0
+
+
+def test_place_liberee_une_seule_fois():
+    voies = Voies(seuil_petite=100, cout_max=1000, places_petite=1, attente=0.01)
+    place = voies.admettre(1)
+    place.liberer()
+    place.liberer()
+    fin = threading.Event()
+
+    def occuper():
+        with voies.admettre(1):
+            fin.wait(1)
+
+    t = threading.Thread(target=occuper)
+    t.start()
+    with pytest.raises(Surcharge):
+        voies.admettre(1)
+    fin.set()
+    t.join()
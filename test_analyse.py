@@ -0,0 +1,60 @@
+from array import array
+from math import sqrt
+
+import pytest
+
+from TP.modules import Analyse
+from TP.modules.PointSet import PointSet
+from TP.modules.Triangulation import Triangulation
+
+
+def _tri(coords, indices):
+    return Triangulation.from_indices(
+        PointSet.from_array(array("f", coords)), array("I", indices)
+    )
+
+
+EQUILATERAL = [0.0, 0.0, 1.0, 0.0, 0.5, sqrt(3) / 2]
+
+
+def test_mesures_triangle_equilateral():
+    m = Analyse.mesurer(_tri(EQUILATERAL, [0, 1, 2]))
+    assert m["aire"][0] == pytest.approx(sqrt(3) / 4, rel=1e-6)
+    assert m["angle_min"][0] == pytest.approx(60.0, abs=1e-3)
+    assert m["angle_max"][0] == pytest.approx(60.0, abs=1e-3)
+    assert m["rayon_circonscrit"][0] == pytest.approx(1 / sqrt(3), rel=1e-6)
+    assert m["rapport_aspect"][0] == pytest.approx(1.0, rel=1e-5)
+    assert m["qualite"][0] == pytest.approx(1.0, rel=1e-5)
+
+
+def test_mesures_triangle_rectangle_et_degenere():
+    tri = _tri([0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 2.0, 0.0], [0, 1, 2, 0, 1, 3])
+    m = Analyse.mesurer(tri)
+    assert m["angle_min"][0] == pytest.approx(45.0, abs=1e-4)
+    assert m["angle_max"][0] == pytest.approx(90.0, abs=1e-4)
+    assert m["aire"][1] == 0.0
+    assert m["qualite"][1] == 0.0
+    # Calcul d'aire seul, identique à la colonne de `mesurer`
+    assert Analyse.aires(tri) == m["aire"]
+    assert tri.aire_totale() == pytest.approx(0.5)
+
+
+def test_resume():
+    tri = _tri(
+        [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 2.0, 0.0], [0, 1, 2, 0, 2, 3, 0, 1, 4]
+    )
+    stats = Analyse.resume(tri)
+    assert stats["triangleCount"] == 3
+    assert stats["degenerateCount"] == 1
+    assert stats["area"]["total"] == pytest.approx(1.0)
+    assert stats["minAngle"]["histogram"] == [1, 0, 0, 0, 2, 0]
+    assert stats["aspectRatio"]["max"] == pytest.approx(
+        sqrt(2) / (2 * (2 - sqrt(2))), rel=1e-5
+    )
+    assert tri.aire_totale() == pytest.approx(1.0)
+
+
+def test_resume_vide_et_mode_liste():
+    assert Analyse.resume(_tri([], []))["area"]["mean"] is None
+    with pytest.raises(ValueError):
+        Analyse.resume(Triangulation())
@@ -0,0 +1,242 @@
+import io
+import os
+import stat
+import struct
+
+import pytest
+
+import TP.modules.PointSet as module_pointset
+import TP.modules.Triangulation as module_triangulation
+from aide_tests import pointset_bin
+from Point import Point
+from TP.modules.PointSet import PointSet, _projeter
+from TP.modules.Triangulation import Triangulation
+
+
+# [1.2] Conversion binaire de "PointSet"
+def test_pointset_from_bytes_adosse_tableau():
+    data = pointset_bin([(0.0, 0.0), (2.0, 0.0), (1.0, 2.0)])
+    ps = PointSet.from_bytes(data)
+    assert len(ps) == 3
+    assert ps.coordinates().typecode == "f"
+    assert list(ps.coordinates()) == [0.0, 0.0, 2.0, 0.0, 1.0, 2.0]
+    assert ps.to_bytes() == data
+
+
+def test_pointset_materialisation_points():
+    ps = PointSet.from_bytes(pointset_bin([(0.5, 1.5), (3.0, 1.0)]))
+    assert ps.get_point(1).get_x() == 3.0
+    ps.add(Point(4.0, 4.0))
+    assert len(ps) == 3
+    assert ps.bounding_box() == (0.5, 1.0, 4.0, 4.0)
+    assert PointSet.from_bytes(ps.to_bytes()).to_bytes() == ps.to_bytes()
+
+
+def test_pointset_from_stream():
+    data = pointset_bin([(float(i), float(-i)) for i in range(100)])
+    ps = PointSet.from_stream(io.BytesIO(data))
+    assert len(ps) == 100
+    assert ps.to_bytes() == data
+
+
+@pytest.mark.parametrize(
+    "data", [b"\x01", pointset_bin([(0.0, 0.0)])[:-1], pointset_bin([]) + b"x"]
+)
+def test_pointset_from_stream_invalide(data):
+    with pytest.raises(ValueError):
+        PointSet.from_stream(io.BytesIO(data))
+
+
+# [1.3] Conversion binaire des triangles
+def test_triangles_roundtrip_indices():
+    data = (
+        pointset_bin([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+        + struct.pack("<I", 2)
+        + struct.pack("<6I", 0, 1, 2, 0, 2, 3)
+    )
+    tri = Triangulation.from_binary(data)
+    assert tri.nombre_triangles() == 2
+    assert list(tri.indices()) == [0, 1, 2, 0, 2, 3]
+    assert tri.to_binary() == data
+    assert [t.get_indices() for t in tri.triangles] == [(0, 1, 2), (0, 2, 3)]
+    assert tri.to_binary() == data
+    assert Triangulation.from_stream(io.BytesIO(data)).to_binary() == data
+
+
+def test_triangles_from_stream_tronque():
+    data = pointset_bin([(0.0, 0.0)]) + struct.pack("<I", 1) + struct.pack("<2I", 0, 0)
+    with pytest.raises(ValueError):
+        Triangulation.from_stream(io.BytesIO(data))
+    with pytest.raises(ValueError):
+        Triangulation.from_binary(data)
+
+
+def test_tranches_sans_decodage():
+    data = (
+        pointset_bin([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)])
+        + struct.pack("<I", 1)
+        + struct.pack("<3I", 0, 1, 2)
+    )
+    assert PointSet.tranche_binaire(data[:28], 2) == pointset_bin([(1.0, 1.0)])
+    assert PointSet.tranche_binaire(data[:28], 5, 1) == pointset_bin([])
+    assert Triangulation.compter_binaire(data) == (3, 1)
+    assert Triangulation.tranche_triangles_binaire(data, 0, 1) == struct.pack(
+        "<4I", 1, 0, 1, 2
+    )
+    with pytest.raises(ValueError):
+        PointSet.tranche_binaire(data, 0, -1)
+
+
+def test_compter_eventail_sans_construire():
+    for n in range(6):
+        ps = PointSet.from_bytes(
+            pointset_bin([(float(i), float(i * i)) for i in range(n)])
+        )
+        binaire = Triangulation.depuis_ensemble_eventail(ps).to_binary()
+        assert Triangulation.compter_eventail(n) == Triangulation.compter_binaire(
+            binaire
+        )
+        # Éventail par indices : même binaire, sans triplets de Point
+        assert Triangulation.eventail(ps).to_binary() == binaire
+
+
+# [1.4] Fichiers projetés en mémoire
+CARRE_TRI = (
+    pointset_bin([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+    + struct.pack("<I", 2)
+    + struct.pack("<6I", 0, 1, 2, 0, 2, 3)
+)
+
+
+def test_pointset_load_vue_lecture_seule(tmp_path):
+    data = pointset_bin([(0.0, 1.0), (2.0, 3.0)])
+    chemin = tmp_path / "ps.bin"
+    chemin.write_bytes(data)
+    ps = PointSet.load(str(chemin))
+    assert isinstance(ps.coordinates(), memoryview)
+    assert ps.coordinates().readonly
+    assert ps.bounding_box() == (0.0, 1.0, 2.0, 3.0)
+    # Copie seulement à la première modification
+    ps.translate(1.0, 0.0)
+    assert list(ps.coordinates()) == [1.0, 1.0, 3.0, 3.0]
+    assert chemin.read_bytes() == data
+
+
+def test_pointset_save_ecriture_tamponnee(tmp_path):
+    chemin = str(tmp_path / "ps.bin")
+    points = [(float(i), float(-i)) for i in range(5000)]
+    PointSet([Point(x, y) for x, y in points]).save(chemin)
+    assert PointSet.load(chemin).to_bytes() == pointset_bin(points)
+    # Réécriture du fichier en cours de projection
+    ps = PointSet.load(chemin)
+    ps.save(chemin)
+    assert ps.get_point(4999).get_y() == -4999.0
+    assert [f.name for f in tmp_path.iterdir()] == ["ps.bin"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permissions POSIX")
+def test_save_permissions_usuelles(tmp_path):
+    umask = os.umask(0)
+    os.umask(umask)
+    PointSet([Point(1.0, 2.0)]).save(str(tmp_path / "ps.bin"))
+    Triangulation.from_binary(CARRE_TRI).save_binary(str(tmp_path / "tri.bin"))
+    Triangulation([(Point(0.0, 0.0), Point(1.0, 0.0), Point(0.0, 1.0))]).save(
+        str(tmp_path / "ancien.bin")
+    )
+    for nom in ("ps.bin", "tri.bin", "ancien.bin"):
+        assert stat.S_IMODE((tmp_path / nom).stat().st_mode) == 0o666 & ~umask
+
+
+def test_pointset_save_nom_temporaire_unique(tmp_path):
+    # Un ancien nom temporaire fixe occupé n'empêche pas l'enregistrement
+    (tmp_path / "ps.bin.tmp").mkdir()
+    chemin = str(tmp_path / "ps.bin")
+    PointSet([Point(1.0, 2.0)]).save(chemin)
+    assert PointSet.load(chemin).to_bytes() == pointset_bin([(1.0, 2.0)])
+    assert sorted(f.name for f in tmp_path.iterdir()) == ["ps.bin", "ps.bin.tmp"]
+
+
+def test_pointset_load_fermeture(tmp_path):
+    chemin = str(tmp_path / "ps.bin")
+    PointSet([Point(0.0, 1.0), Point(2.0, 3.0)]).save(chemin)
+    with PointSet.load(chemin) as ps:
+        projection = ps._projection
+        assert ps.bounding_box() == (0.0, 1.0, 2.0, 3.0)
+    assert projection.closed
+    with pytest.raises(ValueError):
+        ps.coordinates()[0]
+    ps.close()  # sans effet une seconde fois
+    PointSet().close()
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"\x00\x00", pointset_bin([(0.0, 0.0)]) + b"\x00"]
+)
+def test_pointset_load_invalide(tmp_path, monkeypatch, data):
+    projections = []
+
+    def projeter(chemin):
+        projections.append(_projeter(chemin))
+        return projections[-1]
+
+    monkeypatch.setattr(module_pointset, "_projeter", projeter)
+    chemin = tmp_path / "ps.bin"
+    chemin.write_bytes(data)
+    with pytest.raises(ValueError):
+        PointSet.load(str(chemin))
+    # Projection refermée malgré l'erreur (fichier non verrouillé sous Windows)
+    assert all(p.closed for p in projections)
+
+
+def test_triangulation_save_load(tmp_path):
+    chemin = str(tmp_path / "tri.bin")
+    Triangulation.from_binary(CARRE_TRI).save_binary(chemin)
+    tri = Triangulation.load_binary(chemin)
+    assert tri.indices().readonly
+    assert list(tri.indices()) == [0, 1, 2, 0, 2, 3]
+    assert tri.to_binary() == CARRE_TRI
+    assert tri.aire_totale() == pytest.approx(1.0)
+    tri.valider()
+    projection = tri._projection
+    tri.close()
+    assert projection.closed
+    with Triangulation.load_binary(chemin) as tri:
+        assert list(tri.indices()) == [0, 1, 2, 0, 2, 3]
+    assert tri._projection is None
+    os.replace(chemin, chemin + ".bak")  # plus de projection ouverte sur le fichier
+
+
+def test_triangulation_load_validation_differee(tmp_path, monkeypatch):
+    chemin = tmp_path / "tri.bin"
+    chemin.write_bytes(CARRE_TRI[:-4] + struct.pack("<I", 9))
+    tri = Triangulation.load_binary(str(chemin))
+    with pytest.raises(ValueError):
+        tri.valider()
+    tri.close()
+    chemin.write_bytes(CARRE_TRI[:-1])
+    projections = []
+
+    def projeter(chemin):
+        projections.append(_projeter(chemin))
+        return projections[-1]
+
+    monkeypatch.setattr(module_triangulation, "_projeter", projeter)
+    with pytest.raises(ValueError):
+        Triangulation.load_binary(str(chemin))
+    assert projections[0].closed
+
+
+def test_triangulation_points_save_load(tmp_path):
+    chemin = str(tmp_path / "tri.bin")
+    a, b, c = Point(0.0, 0.0), Point(2.0, 0.0), Point(0.0, 2.0)
+    d, e, f = Point(5.0, 5.0), Point(7.0, 5.0), Point(5.0, 7.0)
+    tri = Triangulation([(a, b, c), (d, e, f)])
+    tri.save(chemin)
+    relue = Triangulation.load(chemin)
+    assert len(relue) == 2
+    assert relue.to_bytes() == tri.to_bytes()
+    assert relue.aire_totale() == tri.aire_totale() == 4.0
+    with pytest.raises(ValueError):
+        tri.save_binary(chemin)
+    with pytest.raises(ValueError):
+        Triangulation.from_binary(CARRE_TRI).save(chemin)
@@ -0,0 +1,97 @@
+import asyncio
+import io
+import struct
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("requests")
+
+from Point import Point  # noqa: E402
+from TP.modules.Client import APIClient, APIError, AsyncAPIClient  # noqa: E402
+from TP.modules.PointSet import PointSet  # noqa: E402
+
+UUID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def _reponse(status, raw=b"", json=None):
+    resp = Mock()
+    resp.status_code = status
+    resp.raw = io.BytesIO(raw)
+    resp.json.return_value = json
+    resp.__enter__ = Mock(return_value=resp)
+    resp.__exit__ = Mock(return_value=False)
+    return resp
+
+
+def test_register_point_set():
+    session = Mock()
+    session.post.return_value = _reponse(201, json={"pointSetId": UUID})
+    client = APIClient(session=session, timeout=5)
+    assert client.register_point_set(PointSet([Point(0.0, 0.0)])) == UUID
+    assert session.post.call_args.kwargs["timeout"] == 5
+
+
+def test_get_point_set_flux():
+    data = struct.pack("<I", 2) + struct.pack("<4f", 0.0, 1.0, 2.0, 3.0)
+    session = Mock()
+    session.get.return_value = _reponse(200, raw=data)
+    ps = APIClient(session=session).get_point_set(UUID)
+    assert session.get.call_args.kwargs["stream"] is True
+    assert list(ps.coordinates()) == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_iter_point_set_par_lots():
+    data = struct.pack("<I", 3) + struct.pack("<6f", 0.0, 1.0, 2.0, 3.0, 4.0, 5.0)
+    session = Mock()
+    resp = _reponse(200, raw=data)
+    session.get.return_value = resp
+    lots = list(APIClient(session=session).iter_point_set(UUID, taille_lot=2))
+    assert [list(lot) for lot in lots] == [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0]]
+    assert resp.__exit__.called
+
+
+def test_get_triangulation_erreur():
+    session = Mock()
+    session.get.return_value = _reponse(
+        404, json={"code": "NOT_FOUND", "message": "PointSet introuvable"}
+    )
+    with pytest.raises(APIError) as exc:
+        APIClient(session=session).get_triangulation(UUID)
+    assert exc.value.status_code == 404
+    assert exc.value.code == "NOT_FOUND"
+
+
+def test_async_triangulate_many_parallelisme_borne():
+    en_vol = {"courant": 0, "max": 0}
+    verrou = threading.Lock()
+    # Chaque appel attend qu'un autre soit en vol : les appels se chevauchent
+    # forcément, et un client non borné dépasserait 2
+    rendez_vous = threading.Barrier(2, timeout=5)
+
+    def _compter(resultat):
+        def appel(_):
+            with verrou:
+                en_vol["courant"] += 1
+                en_vol["max"] = max(en_vol["max"], en_vol["courant"])
+            rendez_vous.wait()
+            time.sleep(0.01)
+            with verrou:
+                en_vol["courant"] -= 1
+            return resultat
+
+        return appel
+
+    sync = Mock()
+    sync.register_point_set.side_effect = _compter(UUID)
+    sync.get_triangulation.side_effect = _compter("T")
+
+    async def scenario():
+        async with AsyncAPIClient(client=sync, max_concurrency=2) as client:
+            return await client.triangulate_many([PointSet() for _ in range(10)])
+
+    assert asyncio.run(scenario()) == ["T"] * 10
+    assert sync.register_point_set.call_count == 10
+    assert en_vol["max"] == 2
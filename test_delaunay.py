@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from Point import Point
+from TP.modules.Contraintes import Contraintes
+from TP.modules.Delaunay import trianguler
+from TP.modules.PointSet import PointSet
+
+
+def _ps(coords):
+    return PointSet([Point(float(x), float(y)) for x, y in coords])
+
+
+def _aire(ps, tri):
+    c = ps.coordinates()
+    idx = tri.indices()
+    aire = 0.0
+    for t in range(0, len(idx), 3):
+        a, b, d = idx[t:t + 3]
+        aire += (
+            (c[2 * b] - c[2 * a]) * (c[2 * d + 1] - c[2 * a + 1])
+            - (c[2 * b + 1] - c[2 * a + 1]) * (c[2 * d] - c[2 * a])
+        ) / 2
+    return aire
+
+
+def _aretes(tri):
+    idx = tri.indices()
+    return {
+        frozenset((idx[t + i], idx[t + (i + 1) % 3]))
+        for t in range(0, len(idx), 3)
+        for i in range(3)
+    }
+
+
+# [1.1] Algorithme de triangulation
+def test_delaunay_triangle_et_carre():
+    assert trianguler(_ps([(0, 0), (1, 0), (0, 1)])).nombre_triangles() == 1
+    carre = _ps([(0, 0), (1, 0), (1, 1), (0, 1)])
+    assert trianguler(carre).nombre_triangles() == 2
+
+
+def test_delaunay_cas_degeneres():
+    assert trianguler(_ps([])).nombre_triangles() == 0
+    assert trianguler(_ps([(0, 0), (1, 1)])).nombre_triangles() == 0
+    assert trianguler(_ps([(0, 0), (1, 0), (0, 0), (0, 1)])).nombre_triangles() == 1
+
+
+def test_delaunay_couvre_enveloppe_convexe():
+    random.seed(4)
+    coords = [(0, 0), (1, 0), (1, 1), (0, 1)] + [
+        (random.random(), random.random()) for _ in range(300)
+    ]
+    ps = _ps(coords)
+    assert _aire(ps, trianguler(ps)) == pytest.approx(1.0)
+
+
+def test_segment_contraint_present():
+    random.seed(5)
+    coords = [(0, 0.5), (1, 0.5)] + [
+        (random.random(), random.random()) for _ in range(200)
+    ]
+    tri = trianguler(_ps(coords), Contraintes(segments=[(0, 1)]))
+    assert frozenset((0, 1)) in _aretes(tri) or all(
+        frozenset(e) in _aretes(tri) for e in ((0, 2), (2, 1))
+    )
+
+
+def test_bord_et_trou_retires():
+    coords = [(0, 0), (4, 0), (4, 4), (0, 4), (1, 1), (3, 1), (3, 3), (1, 3), (5, 5)]
+    random.seed(6)
+    coords += [(random.uniform(0, 4), random.uniform(0, 4)) for _ in range(100)]
+    ps = _ps(coords)
+    tri = trianguler(ps, Contraintes(bord=[0, 1, 2, 3], trous=[[4, 5, 6, 7]]))
+    assert _aire(ps, tri) == pytest.approx(12.0)
+    assert 8 not in set(tri.indices())
+
+
+def test_contraintes_invalides():
+    ps = _ps([(0, 0), (4, 0), (4, 4), (0, 4)])
+    with pytest.raises(ValueError):
+        trianguler(ps, Contraintes(segments=[(0, 9)]))
+    with pytest.raises(ValueError):
+        trianguler(ps, Contraintes(bord=[0, 1]))
+    with pytest.raises(ValueError):
+        trianguler(ps, Contraintes(segments=[(0, 2), (1, 3)]))
+
+
+# [1.3] Conversion binaire des contraintes
+def test_contraintes_roundtrip():
+    c = Contraintes(
+        segments=[(0, 1), (2, 3)], bord=[0, 1, 2], trous=[[3, 4, 5], [6, 7, 8, 9]]
+    )
+    back = Contraintes.from_bytes(c.to_bytes())
+    assert (back.segments, back.bord, back.trous) == (c.segments, c.bord, c.trous)
+    with pytest.raises(ValueError):
+        Contraintes.from_bytes(c.to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        Contraintes.from_bytes(c.to_bytes() + b"\x00")
@@ -0,0 +1,29 @@
+import sys
+
+from TP.modules.Demarrage import ModuleDiffere, rapport_imports
+
+
+# [1.6] Démarrage : modules différés
+def test_module_differe_charge_au_premier_acces():
+    nom = "TP.modules.Analyse"
+    sys.modules.pop(nom, None)
+    module = ModuleDiffere(nom)
+    assert not module.est_charge()
+    assert nom not in sys.modules
+    assert callable(module.resume)
+    assert module.est_charge()
+    assert module.charger() is sys.modules[nom]
+
+
+def test_module_differe_attribut_masque():
+    module = ModuleDiffere("json")
+    module.dumps = lambda obj: "remplacé"
+    assert module.dumps({}) == "remplacé"
+    assert module.loads("1") == 1
+
+
+def test_rapport_imports():
+    rapport = rapport_imports("json", nombre=3)
+    assert rapport[0][0] == "json"
+    assert len(rapport) <= 3
+    assert all(cumule >= propre for _, propre, cumule in rapport)
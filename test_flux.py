@@ -0,0 +1,118 @@
+import io
+import struct
+from array import array
+
+import pytest
+
+from aide_tests import pointset_bin
+from TP.modules.Flux import (
+    EcrivainPointSet,
+    LecteurPointSet,
+    lire_par_lots,
+    traiter_par_lots,
+)
+from TP.modules.PointSet import PointSet
+
+POINTS = [(float(i), float(2 * i)) for i in range(10)]
+
+
+class _FluxSimple:
+    """Flux sans `seek` ni `readinto` (tube, réponse HTTP...)."""
+
+    def __init__(self, data=b""):
+        self._source = io.BytesIO(data)
+        self.ecrit = bytearray()
+
+    def read(self, n=-1):
+        return self._source.read(n)
+
+    def write(self, b):
+        self.ecrit.extend(b)
+        return len(b)
+
+
+# [1.8] Lecture et écriture par lots
+def test_lecteur_par_lots():
+    lecteur = LecteurPointSet(_FluxSimple(pointset_bin(POINTS)), taille_lot=4)
+    assert lecteur.nombre == 10
+    lots = list(lecteur)
+    assert [len(lot) // 2 for lot in lots] == [4, 4, 2]
+    assert all(lot.typecode == "f" for lot in lots)
+    assert list(lots[2]) == [8.0, 16.0, 9.0, 18.0]
+    assert list(lire_par_lots(io.BytesIO(pointset_bin([])))) == []
+
+
+@pytest.mark.parametrize(
+    "data", [b"\x01", pointset_bin(POINTS)[:-1], pointset_bin(POINTS) + b"\x00"]
+)
+def test_lecteur_flux_invalide(data):
+    with pytest.raises(ValueError):
+        list(lire_par_lots(io.BytesIO(data), 3))
+
+
+def test_ecrivain_entete_corrige_par_seek():
+    dest = io.BytesIO(b"prefixe")
+    dest.seek(0, io.SEEK_END)
+    with EcrivainPointSet(dest) as ecrivain:
+        ecrivain.ecrire(array("f", [0.0, 0.0, 1.0, 2.0]))
+        ecrivain.ecrire([3.0, 4.0])
+    assert dest.getvalue() == b"prefixe" + pointset_bin(
+        [(0.0, 0.0), (1.0, 2.0), (3.0, 4.0)]
+    )
+
+
+def test_ecrivain_nombre_annonce():
+    dest = _FluxSimple()
+    with EcrivainPointSet(dest, nombre=2) as ecrivain:
+        assert bytes(dest.ecrit) == struct.pack("<I", 2)  # en-tête écrit d'emblée
+        ecrivain.ecrire(PointSet.from_bytes(pointset_bin(POINTS[:2])).coordinates())
+    assert bytes(dest.ecrit) == pointset_bin(POINTS[:2])
+    with (
+        pytest.raises(ValueError),
+        EcrivainPointSet(_FluxSimple(), nombre=1) as ecrivain,
+    ):
+        ecrivain.ecrire([0.0, 0.0, 1.0, 1.0])
+    with (
+        pytest.raises(ValueError),
+        EcrivainPointSet(_FluxSimple(), nombre=3) as ecrivain,
+    ):
+        ecrivain.ecrire([0.0, 0.0])
+
+
+def test_ecrivain_sans_seek_ni_nombre(monkeypatch):
+    monkeypatch.setattr("TP.modules.Flux.TAMPON_MEMOIRE", 16)  # tampon sur disque
+    dest = _FluxSimple()
+    with EcrivainPointSet(dest) as ecrivain:
+        for lot in lire_par_lots(io.BytesIO(pointset_bin(POINTS)), 3):
+            ecrivain.ecrire(lot)
+    assert bytes(dest.ecrit) == pointset_bin(POINTS)
+
+
+def test_ecrivain_lot_invalide():
+    with EcrivainPointSet(io.BytesIO()) as ecrivain:
+        with pytest.raises(ValueError):
+            ecrivain.ecrire([1.0])
+        with pytest.raises(ValueError):
+            ecrivain.ecrire(array("d", [1.0, 2.0]))
+
+
+def test_traiter_par_lots_filtre():
+    dest = _FluxSimple()
+
+    def pairs(lot):
+        return array(
+            "f",
+            [
+                c
+                for i in range(0, len(lot), 2)
+                if lot[i] % 2 == 0
+                for c in lot[i : i + 2]
+            ],
+        )
+
+    n = traiter_par_lots(io.BytesIO(pointset_bin(POINTS)), dest, pairs, taille_lot=3)
+    assert n == 5
+    assert bytes(dest.ecrit) == pointset_bin(POINTS[0::2])
+    copie = io.BytesIO()
+    assert traiter_par_lots(io.BytesIO(pointset_bin(POINTS)), copie) == 10
+    assert copie.getvalue() == pointset_bin(POINTS)
@@ -0,0 +1,72 @@
+from array import array
+from math import pi
+
+import pytest
+
+from Point import Point
+from TP.modules.PointSet import PointSet
+
+
+def _ps(coords):
+    return PointSet.from_array(array("f", coords))
+
+
+# [1.5] Géométrie en bloc des PointSet
+def test_bbox_et_centroide():
+    ps = _ps([0.0, 0.0, 4.0, 0.0, 4.0, 2.0, 0.0, 2.0])
+    assert ps.bbox_and_centroid() == ((0.0, 0.0, 4.0, 2.0), (2.0, 1.0))
+    assert ps.bounding_box() == (0.0, 0.0, 4.0, 2.0)
+    assert ps.centroid() == (2.0, 1.0)
+    assert PointSet().bbox_and_centroid() is None
+    assert PointSet().centroid() is None
+
+
+def test_bbox_points_exacte():
+    # Ensemble de Point : valeurs exactes, sans passage par un tableau float32
+    ps = PointSet([Point(0.1, 0.2), Point(0.3, 0.7)])
+    assert ps.bounding_box() == (0.1, 0.2, 0.3, 0.7)
+    assert PointSet([Point(0.1, 0.2)]).bbox_and_centroid() == (
+        (0.1, 0.2, 0.1, 0.2),
+        (0.1, 0.2),
+    )
+    assert list(PointSet([Point(0.1, 0.1), Point(0.1, 0.1 + 1e-9)]).convex_hull()) == [
+        0,
+        1,
+    ]
+
+
+def test_enveloppe_convexe():
+    # Carré, son centre, un point aligné sur un côté et un doublon
+    ps = _ps([0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.5, 0.5, 0.5, 0.0, 1.0, 1.0])
+    hull = ps.convex_hull()
+    assert hull.typecode == "I"
+    assert sorted(hull) in ([0, 1, 2, 3], [0, 1, 3, 6])
+    assert list(hull)[:2] == [0, 1]  # sens direct depuis le point le plus bas à gauche
+
+
+def test_enveloppe_convexe_cas_degeneres():
+    assert list(PointSet().convex_hull()) == []
+    assert list(_ps([1.0, 1.0]).convex_hull()) == [0]
+    assert list(_ps([1.0, 1.0, 1.0, 1.0, 1.0, 1.0]).convex_hull()) == [0]
+    assert list(_ps([0.0, 0.0, 1.0, 1.0, 2.0, 2.0]).convex_hull()) == [0, 2]
+
+
+def test_transformations_en_place_tableau():
+    coords = array("f", [1.0, 0.0, 0.0, 2.0])
+    ps = PointSet.from_array(coords)
+    ps.translate(1.0, -1.0)
+    assert list(coords) == [2.0, -1.0, 1.0, 1.0]  # même tableau, modifié sur place
+    ps.scale(2.0, origin=(1.0, 1.0))
+    assert list(coords) == [3.0, -3.0, 1.0, 1.0]
+    ps.rotate(pi / 2, origin=(1.0, 1.0))
+    assert list(coords) == pytest.approx([5.0, 3.0, 1.0, 1.0], abs=1e-6)
+
+
+def test_transformations_en_place_points():
+    p = Point(1.0, 2.0)
+    ps = PointSet([p, Point(3.0, 4.0)])
+    ps.scale(2.0, 3.0)
+    ps.translate(-1.0, 0.0)
+    assert (p.get_x(), p.get_y()) == (1.0, 6.0)
+    ps.rotate(pi)
+    assert ps.bounding_box() == pytest.approx((-5.0, -12.0, -1.0, -6.0))
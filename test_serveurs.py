@@ -0,0 +1,415 @@
+import io
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+
+import start_servers  # noqa: E402
+from aide_tests import pointset_bin  # noqa: E402
+
+UUID_INCONNU = "00000000-0000-0000-0000-000000000000"
+
+
+CARRE = pointset_bin([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+
+
+class _ReponseManager:
+    """Réponse `requests` minimale construite depuis le client de test Flask."""
+
+    def __init__(self, resp):
+        self.status_code = resp.status_code
+        self.headers = resp.headers
+        self.raw = io.BytesIO(resp.get_data())
+        self._json = resp.get_json(silent=True)
+
+    def json(self):
+        return self._json
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def manager():
+    start_servers._STORAGE = start_servers.StockageContenu()
+    return start_servers.manager_app.test_client()
+
+
+@pytest.fixture
+def triangulator(manager, monkeypatch):
+    # Caches du module vidés : aucun résultat ne passe d'un test à l'autre
+    monkeypatch.setattr(start_servers, "_RESULTS", start_servers.CacheLRU(1024 * 1024))
+    monkeypatch.setattr(
+        start_servers, "_HASHES", start_servers.CacheLRU(100, taille=lambda _: 1)
+    )
+    monkeypatch.setattr(
+        start_servers, "_STATS", start_servers.CacheLRU(100, taille=lambda _: 1)
+    )
+    monkeypatch.setattr(
+        start_servers, "_PYRAMIDS", start_servers.CacheLRU(8, taille=lambda _: 1)
+    )
+    monkeypatch.setattr(start_servers, "_TILES", start_servers.CacheLRU(1024 * 1024))
+    appels = []
+
+    def fake_get(url, **kwargs):
+        chemin = url[len(start_servers.MANAGER_URL) :]
+        resp = _ReponseManager(manager.get(chemin, headers=kwargs.get("headers")))
+        appels.append((url, resp.status_code))
+        return resp
+
+    monkeypatch.setattr(start_servers.requests, "get", fake_get)
+    client = start_servers.triangulator_app.test_client()
+    client.appels = appels
+    return client
+
+
+def _enregistrer(manager, data=CARRE):
+    r = manager.post("/pointset", data=data)
+    assert r.status_code == 201
+    return r.get_json()
+
+
+# [2.1] Le "Endpoint" POST/GET /pointset
+def test_manager_deduplication(manager):
+    a = _enregistrer(manager)
+    b = _enregistrer(manager)
+    assert a["pointSetId"] != b["pointSetId"]
+    assert a["contentHash"] == b["contentHash"]
+    assert start_servers._STORAGE.nombre_blobs() == 1
+    r = manager.get(f"/pointset/{b['pointSetId']}")
+    assert r.get_data() == CARRE
+    assert r.headers[start_servers.HASH_HEADER] == a["contentHash"]
+
+
+def test_manager_suppression(manager):
+    a = _enregistrer(manager)
+    assert manager.delete(f"/pointset/{a['pointSetId']}").status_code == 204
+    assert manager.get(f"/pointset/{a['pointSetId']}").status_code == 404
+    assert manager.delete(f"/pointset/{a['pointSetId']}").status_code == 404
+    assert start_servers._STORAGE.nombre_blobs() == 0
+
+
+# [2.2] Le Triangulator et le cache par contenu
+def test_triangulation_reutilisee_entre_ids(triangulator, manager):
+    a = _enregistrer(manager)
+    b = _enregistrer(manager)
+    r1 = triangulator.get(f"/triangulation/{a['pointSetId']}")
+    r2 = triangulator.get(f"/triangulation/{b['pointSetId']}")
+    assert r1.status_code == r2.status_code == 200
+    assert r1.get_data() == r2.get_data()
+    assert a["contentHash"] in start_servers._RESULTS
+    # Second appel pour `a` : le manager confirme l'UUID sans renvoyer le corps
+    triangulator.get(f"/triangulation/{a['pointSetId']}")
+    assert [statut for _, statut in triangulator.appels] == [200, 200, 304]
+
+
+def test_triangulation_apres_suppression(triangulator, manager):
+    a = _enregistrer(manager)
+    r = triangulator.get(f"/triangulation/{a['pointSetId']}")
+    assert r.status_code == 200
+    assert manager.delete(f"/pointset/{a['pointSetId']}").status_code == 204
+    assert triangulator.get(f"/triangulation/{a['pointSetId']}").status_code == 404
+    r404 = triangulator.get(
+        f"/triangulation/{a['pointSetId']}",
+        headers={"If-None-Match": r.headers["ETag"]},
+    )
+    assert r404.status_code == 404
+
+
+def test_triangulation_not_found(triangulator):
+    assert triangulator.get(f"/triangulation/{UUID_INCONNU}").status_code == 404
+    assert triangulator.get("/triangulation/123").status_code == 400
+
+
+# [2.3] Cache HTTP : ETag et requêtes conditionnelles
+def test_manager_etag_conditionnel(manager):
+    a = _enregistrer(manager)
+    r = manager.get(f"/pointset/{a['pointSetId']}")
+    assert r.headers["ETag"] == f'"{a["contentHash"]}"'
+    assert "immutable" in r.headers["Cache-Control"]
+    r304 = manager.get(
+        f"/pointset/{a['pointSetId']}", headers={"If-None-Match": r.headers["ETag"]}
+    )
+    assert r304.status_code == 304
+    assert r304.get_data() == b""
+    autre = manager.get(
+        f"/pointset/{a['pointSetId']}", headers={"If-None-Match": '"autre"'}
+    )
+    assert autre.status_code == 200
+
+
+def test_triangulation_etag_conditionnel(triangulator, manager):
+    a = _enregistrer(manager)
+    r = triangulator.get(f"/triangulation/{a['pointSetId']}")
+    etag = r.headers["ETag"]
+    assert etag != f'"{a["contentHash"]}"'
+    assert "immutable" in r.headers["Cache-Control"]
+    r304 = triangulator.get(
+        f"/triangulation/{a['pointSetId']}", headers={"If-None-Match": etag}
+    )
+    assert r304.status_code == 304
+    # Un autre UUID de même contenu partage l'ETag
+    b = _enregistrer(manager)
+    r304 = triangulator.get(
+        f"/triangulation/{b['pointSetId']}", headers={"If-None-Match": etag}
+    )
+    assert r304.status_code == 304
+
+
+# [2.4] Récupération partielle
+def test_manager_tranche_offset_count(manager):
+    a = _enregistrer(manager)
+    r = manager.get(f"/pointset/{a['pointSetId']}?offset=1&count=2")
+    assert r.status_code == 200
+    assert r.get_data() == pointset_bin([(1.0, 0.0), (1.0, 1.0)])
+    assert manager.get(f"/pointset/{a['pointSetId']}?offset=-1").status_code == 400
+    assert manager.get(f"/pointset/{a['pointSetId']}?count=abc").status_code == 400
+
+
+def test_manager_range_http(manager):
+    a = _enregistrer(manager)
+    r = manager.get(f"/pointset/{a['pointSetId']}", headers={"Range": "bytes=0-3"})
+    assert r.status_code == 206
+    assert r.get_data() == struct.pack("<I", 4)
+    assert r.headers["Content-Range"] == f"bytes 0-3/{len(CARRE)}"
+    assert (
+        manager.get(
+            f"/pointset/{a['pointSetId']}", headers={"Range": "bytes=999-"}
+        ).status_code
+        == 416
+    )
+
+
+def test_manager_entete(manager):
+    a = _enregistrer(manager)
+    r = manager.get(f"/pointset/{a['pointSetId']}/header")
+    assert r.get_json()["pointCount"] == 4
+    assert r.get_json()["boundingBox"] == [0.0, 0.0, 1.0, 1.0]
+    assert r.get_json()["centroid"] == [0.5, 0.5]
+    assert manager.get(f"/pointset/{UUID_INCONNU}/header").status_code == 404
+
+
+def test_manager_enveloppe_convexe(manager):
+    a = _enregistrer(manager)
+    r = manager.get(f"/pointset/{a['pointSetId']}/hull")
+    assert sorted(r.get_json()["convexHull"]) == [0, 1, 2, 3]
+    assert (
+        "convexHull"
+        not in manager.get(f"/pointset/{a['pointSetId']}/header").get_json()
+    )
+    assert manager.get(f"/pointset/{UUID_INCONNU}/hull").status_code == 404
+    assert manager.get("/pointset/pas-un-uuid/hull").status_code == 400
+
+
+def test_triangulation_sections(triangulator, manager):
+    a = _enregistrer(manager)
+    complet = triangulator.get(f"/triangulation/{a['pointSetId']}").get_data()
+    sommets = triangulator.get(
+        f"/triangulation/{a['pointSetId']}?part=vertices"
+    ).get_data()
+    assert sommets == CARRE
+    tris = triangulator.get(
+        f"/triangulation/{a['pointSetId']}?part=triangles&offset=1&count=5"
+    ).get_data()
+    assert tris == struct.pack("<4I", 1, 0, 2, 3)
+    assert complet.startswith(CARRE)
+    assert (
+        triangulator.get(f"/triangulation/{a['pointSetId']}?offset=1").status_code
+        == 400
+    )
+    assert (
+        triangulator.get(f"/triangulation/{a['pointSetId']}?part=autre").status_code
+        == 400
+    )
+    for requete in ("part=vertices&offset=-1", "part=triangles&count=-2"):
+        r = triangulator.get(f"/triangulation/{a['pointSetId']}?{requete}")
+        assert r.status_code == 400
+        assert r.get_json()["code"] == "BAD_RANGE"
+
+
+def test_triangulation_entete(triangulator, manager):
+    a = _enregistrer(manager)
+    r = triangulator.get(f"/triangulation/{a['pointSetId']}/header")
+    assert r.get_json() == {
+        "pointSetId": a["pointSetId"],
+        "vertexCount": 4,
+        "triangleCount": 2,
+        "boundingBox": [0.0, 0.0, 1.0, 1.0],
+    }
+    # Lu dans l'en-tête du manager, sans triangulation
+    assert triangulator.appels == [
+        (f"{start_servers.MANAGER_URL}/pointset/{a['pointSetId']}/header", 200)
+    ]
+    assert triangulator.get(f"/triangulation/{UUID_INCONNU}/header").status_code == 404
+    # Moins de trois points : maillage vide, sans boîte englobante
+    b = _enregistrer(manager, pointset_bin([(0.0, 0.0), (1.0, 1.0)]))
+    r = triangulator.get(f"/triangulation/{b['pointSetId']}/header")
+    assert r.get_json()["vertexCount"] == 0
+    assert r.get_json()["boundingBox"] is None
+
+
+# [2.5] Tuilage
+def test_triangulation_tuiles(triangulator, manager):
+    a = _enregistrer(manager)
+    desc = triangulator.get(f"/triangulation/{a['pointSetId']}/tiles").get_json()
+    assert desc["origin"] == [0.0, 0.0] and desc["size"] == 1.0
+    r = triangulator.get(f"/triangulation/{a['pointSetId']}/tiles/0/0/0")
+    assert r.status_code == 200
+    assert "immutable" in r.headers["Cache-Control"]
+    assert (
+        triangulator.get(
+            f"/triangulation/{a['pointSetId']}/tiles/0/0/0",
+            headers={"If-None-Match": r.headers["ETag"]},
+        ).status_code
+        == 304
+    )
+    assert (
+        triangulator.get(f"/triangulation/{a['pointSetId']}/tiles/0/1/0").status_code
+        == 400
+    )
+
+
+# [2.6] Triangulation contrainte
+def test_triangulation_contrainte(triangulator, manager):
+    from TP.modules.Contraintes import Contraintes
+    from TP.modules.Triangulation import Triangulation
+
+    # Carré extérieur, carré intérieur en trou
+    data = pointset_bin(
+        [
+            (0.0, 0.0),
+            (4.0, 0.0),
+            (4.0, 4.0),
+            (0.0, 4.0),
+            (1.0, 1.0),
+            (3.0, 1.0),
+            (3.0, 3.0),
+            (1.0, 3.0),
+        ]
+    )
+    a = _enregistrer(manager, data)
+    corps = Contraintes(bord=[0, 1, 2, 3], trous=[[4, 5, 6, 7]]).to_bytes()
+    r = triangulator.post(f"/triangulation/{a['pointSetId']}", data=corps)
+    assert r.status_code == 200
+    tri = Triangulation.from_binary(r.get_data())
+    assert tri.nombre_triangles() == 8
+    assert all(set(t.get_indices()) != {4, 5, 6} for t in tri.triangles)
+    sans = triangulator.post(f"/triangulation/{a['pointSetId']}")
+    assert Triangulation.from_binary(sans.get_data()).nombre_triangles() == 10
+    hors = Contraintes(segments=[(0, 99)]).to_bytes()
+    assert (
+        triangulator.post(f"/triangulation/{a['pointSetId']}", data=hors).status_code
+        == 400
+    )
+    assert (
+        triangulator.post(f"/triangulation/{a['pointSetId']}", data=b"\x01").status_code
+        == 400
+    )
+
+
+# [2.7] Statistiques de maillage
+def test_triangulation_stats(triangulator, manager):
+    a = _enregistrer(manager)
+    stats = triangulator.get(f"/triangulation/{a['pointSetId']}/stats").get_json()
+    assert stats["triangleCount"] == 2
+    assert stats["area"]["total"] == pytest.approx(1.0)
+    assert stats["minAngle"]["min"] == pytest.approx(45.0)
+
+
+# [2.8] Démarrage : imports différés et préchauffage
+def test_imports_differes():
+    code = (
+        "import sys, start_servers; "
+        "print(sorted(m for m in start_servers._DEFERRED if m._nom in sys.modules))"
+    )
+    sortie = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    assert sortie.stdout.strip() == "[]"
+
+
+def test_ready_apres_prechauffage(triangulator, monkeypatch):
+    monkeypatch.setattr(start_servers, "_READY", threading.Event())
+    r = triangulator.get("/ready")
+    assert r.status_code == 503
+    assert r.get_json()["code"] == "NOT_READY"
+    start_servers.warm_up()
+    r = triangulator.get("/ready")
+    assert r.status_code == 200
+    assert r.get_json()["warmUpSeconds"] >= 0
+    assert len(start_servers._RESULTS) == 0
+
+
+# [2.9] Admission : limites avant lecture du corps, voies de calcul
+def test_manager_limites_entete(manager, monkeypatch):
+    # En-tête annonçant 2^32 - 1 points : refusé sans lire la suite
+    r = manager.post("/pointset", data=struct.pack("<I", 2**32 - 1) + b"\x00" * 8)
+    assert r.status_code == 413
+    assert r.get_json()["code"] == "TOO_MANY_POINTS"
+    monkeypatch.setattr(start_servers, "MAX_BODY_BYTES", len(CARRE) - 1)
+    assert manager.post("/pointset", data=CARRE).get_json()["code"] == "TOO_LARGE"
+    assert (
+        manager.post("/pointset", data=CARRE + b"\x00").get_json()["code"]
+        == "TOO_LARGE"
+    )
+    monkeypatch.setattr(start_servers, "MAX_BODY_BYTES", len(CARRE) + 1)
+    assert manager.post("/pointset", data=CARRE + b"\x00").status_code == 400
+    assert manager.post("/pointset", data=CARRE).status_code == 201
+    assert start_servers._STORAGE.get(_enregistrer(manager)["pointSetId"]) == CARRE
+
+
+def test_triangulation_cout_excessif(triangulator, manager, monkeypatch):
+    monkeypatch.setattr(start_servers, "_LANES", start_servers.Voies(1, 3))
+    a = _enregistrer(manager)
+    r = triangulator.get(f"/triangulation/{a['pointSetId']}")
+    assert r.status_code == 413
+    assert r.get_json()["code"] == "TOO_EXPENSIVE"
+
+
+def test_triangulation_voie_saturee(triangulator, manager, monkeypatch):
+    voies = start_servers.Voies(100, 1000, places_petite=1, attente=0.01)
+    monkeypatch.setattr(start_servers, "_LANES", voies)
+    a = _enregistrer(manager)
+    with voies.admettre(1):
+        r = triangulator.get(f"/triangulation/{a['pointSetId']}")
+        assert r.status_code == 503
+        assert r.get_json()["code"] == "OVERLOADED"
+        assert "Retry-After" in r.headers
+    assert triangulator.get(f"/triangulation/{a['pointSetId']}").status_code == 200
+    assert voies.occupation()["small"]["busy"] == 0
+
+
+def test_eventail_petite_voie_rapide(triangulator, manager):
+    # Le plus gros éventail admis en petite voie : calcul linéaire, bref
+    n = start_servers.SMALL_LANE_MAX_COST
+    assert (
+        start_servers.cout_triangulation(n, False) <= start_servers.SMALL_LANE_MAX_COST
+    )
+    a = _enregistrer(
+        manager, pointset_bin([(float(i), float(i % 7)) for i in range(n)])
+    )
+    debut = time.perf_counter()
+    r = triangulator.get(f"/triangulation/{a['pointSetId']}")
+    assert time.perf_counter() - debut < 2.0
+    assert r.status_code == 200
+    assert start_servers.Triangulation.compter_binaire(r.get_data()) == (n, n - 2)
+
+
+def test_contraintes_trop_grandes(triangulator, manager, monkeypatch):
+    monkeypatch.setattr(start_servers, "MAX_CONSTRAINTS_BYTES", 8)
+    a = _enregistrer(manager)
+    r = triangulator.post(f"/triangulation/{a['pointSetId']}", data=b"\x00" * 12)
+    assert r.status_code == 413
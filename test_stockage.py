@@ -0,0 +1,63 @@
+import pytest
+
+from TP.modules.Stockage import CacheLRU, StockageContenu, empreinte
+
+
+def test_stockage_deduplication():
+    s = StockageContenu()
+    h1 = s.ajouter("a", b"\x00\x00\x00\x00")
+    h2 = s.ajouter("b", b"\x00\x00\x00\x00")
+    assert h1 == h2 == empreinte(b"\x00\x00\x00\x00")
+    assert len(s) == 2
+    assert s.nombre_blobs() == 1
+    assert s.references(h1) == 2
+    assert s.get("b") == b"\x00\x00\x00\x00"
+
+
+def test_stockage_liberation_derniere_reference():
+    s = StockageContenu()
+    h = s.ajouter("a", b"x")
+    s.ajouter("b", b"x")
+    assert s.retirer("a")
+    assert s.nombre_blobs() == 1
+    assert s.retirer("b")
+    assert s.nombre_blobs() == 0
+    assert s.references(h) == 0
+    assert not s.retirer("b")
+    assert s.get("b") is None
+
+
+def test_stockage_identifiant_deja_utilise():
+    s = StockageContenu()
+    s.ajouter("a", b"x")
+    with pytest.raises(KeyError):
+        s.ajouter("a", b"y")
+
+
+def test_cache_lru_eviction():
+    c = CacheLRU(10)
+    c.put("a", b"12345")
+    c.put("b", b"12345")
+    assert c.get("a") == b"12345"  # "a" devient le plus récent
+    c.put("c", b"123")
+    assert "b" not in c
+    assert c.get("a") is not None and c.get("c") is not None
+    c.put("d", b"x" * 11)  # plus grand que la capacité : ignoré
+    assert "d" not in c
+
+
+def test_stockage_derive_calcule_une_fois():
+    s = StockageContenu()
+    s.ajouter("a", b"xy")
+    s.ajouter("b", b"xy")
+    appels = []
+
+    def calcul(data):
+        appels.append(data)
+        return len(data)
+
+    assert s.derive("a", "taille", calcul) == 2
+    assert s.derive("b", "taille", calcul) == 2
+    assert appels == [b"xy"]
+    with pytest.raises(KeyError):
+        s.derive("c", "taille", calcul)
@@ -0,0 +1,62 @@
+from array import array
+
+import pytest
+
+from TP.modules.PointSet import PointSet
+from TP.modules.Triangulation import Triangulation
+from TP.modules.Tuilage import PyramideTuiles
+
+
+def _grille(n):
+    """Maillage régulier de n x n sommets sur [0, 1]², deux triangles par carré."""
+    coords = array("f")
+    for j in range(n):
+        for i in range(n):
+            coords.extend((i / (n - 1), j / (n - 1)))
+    indices = array("I")
+    for j in range(n - 1):
+        for i in range(n - 1):
+            a = j * n + i
+            indices.extend((a, a + 1, a + n + 1, a, a + n + 1, a + n))
+    return Triangulation.from_indices(PointSet.from_array(coords), indices)
+
+
+def test_tuiles_niveau_max_couvrent_le_maillage():
+    pyramide = PyramideTuiles(_grille(9), zoom_max=2, resolution=4)
+    vus = set()
+    for x in range(4):
+        for y in range(4):
+            tuile = pyramide.tuile(2, x, y)
+            idx = tuile.indices()
+            assert max(idx, default=-1) < len(tuile.vertices)
+            c = tuile.vertices.coordinates()
+            for t in range(0, len(idx), 3):
+                vus.add(
+                    frozenset(
+                        (c[2 * idx[t + k]], c[2 * idx[t + k] + 1]) for k in range(3)
+                    )
+                )
+    assert len(vus) == 2 * 8 * 8
+
+
+def test_tuile_ne_garde_que_ses_triangles():
+    pyramide = PyramideTuiles(_grille(9), zoom_max=2, resolution=4)
+    tuile = pyramide.tuile(2, 0, 0)
+    x0, y0, x1, y1 = pyramide.rectangle(2, 0, 0)
+    c = tuile.vertices.coordinates()
+    for x, y in zip(c[0::2], c[1::2], strict=True):
+        assert x0 - 0.25 <= x <= x1 + 0.25 and y0 - 0.25 <= y <= y1 + 0.25
+    assert 0 < tuile.nombre_triangles() < 2 * 8 * 8
+
+
+def test_niveaux_grossiers_simplifies():
+    pyramide = PyramideTuiles(_grille(33), zoom_max=3, resolution=2)
+    grossier = pyramide.tuile(0, 0, 0)
+    assert 0 < grossier.nombre_triangles() < 2 * 32 * 32
+    assert len(grossier.vertices) < 33 * 33
+
+
+@pytest.mark.parametrize("z,x,y", [(-1, 0, 0), (3, 0, 0), (1, 2, 0), (0, 0, -1)])
+def test_tuile_hors_pyramide(z, x, y):
+    with pytest.raises(ValueError):
+        PyramideTuiles(_grille(3), zoom_max=2).tuile(z, x, y)